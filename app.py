@@ -78,7 +78,7 @@ def main():
     window.show()
 
     coalescer.pathsCollected.connect(
-        lambda paths: window.viewmodel.load_files_from_paths(paths) if paths else None
+        lambda paths: window.load_files(paths) if paths else None
     )
 
     sys.exit(app.exec())
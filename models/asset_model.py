@@ -5,8 +5,10 @@ Contains data structures and business logic for assets
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import wraps
 import json
 from pathlib import Path
+from threading import Lock, RLock
 from typing import Any, BinaryIO, Optional
 
 from PIL import Image as PILImage
@@ -16,17 +18,50 @@ from UnityPy.files import ObjectReader
 from UnityPy.enums import ClassIDType
 from UnityPy.tools.extractor import exportTextAsset, exportTexture2D, exportMesh
 
-AVAILABLE_ASSETS_FOR_EDIT = [
+AVAILABLE_ASSETS_FOR_EDIT = frozenset({
     ClassIDType.Texture2D, 
     ClassIDType.TextAsset, 
     # ClassIDType.Mesh
-]
+})
 
-AVAILABLE_ASSETS_FOR_EXPORT = [
+AVAILABLE_ASSETS_FOR_EXPORT = frozenset({
     ClassIDType.Texture2D, 
     ClassIDType.TextAsset, 
     # ClassIDType.Mesh,
-]
+})
+
+# Per-bundle locks: UnityPy object readers of one bundle share a stream and
+# are not thread-safe, so previews, exports, edits and saves of the same
+# source file must not run at the same time
+_source_locks: dict[str, RLock] = {}
+_source_locks_guard = Lock()
+
+
+def source_lock(source_path: str) -> RLock:
+    """
+    Get the lock serialising access to one loaded bundle
+    
+    Args:
+        source_path: Loaded file path (AssetInfo.source_path)
+        
+    Returns:
+        Re-entrant lock shared by every user of that bundle
+    """
+    with _source_locks_guard:
+        lock = _source_locks.get(source_path)
+        if lock is None:
+            lock = _source_locks[source_path] = RLock()
+        return lock
+
+
+def _locked_by_source(method):
+    """Run an AssetInfo method while holding its bundle's source_lock"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with source_lock(self.source_path):
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class ResultStatus(str, Enum):
     """Status of operation results"""
@@ -105,6 +140,12 @@ class AssetInfo:
             self._readed_data = self._obj.read()
             return self._readed_data
     
+    @property
+    def cached_preview(self) -> Optional[PreviewResult]:
+        """Preview generated by an earlier get_preview() call, if still valid"""
+        return self._preview_data
+    
+    @_locked_by_source
     def get_preview(self) -> PreviewResult:
         """
         Generate preview data for the asset
@@ -159,6 +200,7 @@ class AssetInfo:
             )
         return self._preview_data
 
+    @_locked_by_source
     def edit_data(self, new_data: Image | str | BinaryIO) -> EditResult:
         """
         Edit asset data with new content
@@ -255,6 +297,21 @@ class AssetInfo:
             self._preview_data = None
         return result
     
+    def default_export_name(self) -> str:
+        """File name export() writes to when no output_name is given"""
+        if self.container:
+            full_name = Path(self.container).name
+            suffix = ""
+        else:
+            full_name = self.name
+            suffix = "_" + self.path_id
+
+        # Split at first dot only
+        parts = full_name.split('.')
+        file_extension = f".{parts[1]}" if len(parts) > 1 else ""
+        return f"{parts[0]}{suffix}{file_extension}"
+
+    @_locked_by_source
     def export(self, output_dir: str | Path, output_name: Optional[str] = None) -> ExportResult:
         """
         Export asset to file system
@@ -271,22 +328,12 @@ class AssetInfo:
             output_dir = Path(output_dir).resolve()
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            need_to_add_path_id = False
-            
-            if output_name:
-                full_name = output_name
-            elif self.container:
-                full_name = Path(self.container).name
-            else:
-                full_name = self.name
-                need_to_add_path_id = True
+            full_name = output_name or self.default_export_name()
 
             # Split at first dot only
             parts = full_name.split('.') 
             
             file_name = parts[0]
-            if need_to_add_path_id:
-                file_name += "_" + self.path_id
             
             file_extension = ""
             if len(parts) > 1:
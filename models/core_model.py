@@ -3,28 +3,32 @@ Core Model Layer - MVVM Pattern
 Contains core business logic for loading and managing Unity assets
 """
 
+import os
 import time
 import logging
 from pathlib import Path
-from typing import Literal, Callable, Optional
+from typing import Iterable, Iterator, Literal, Callable, Optional
 
 from UnityPy import Environment
 from UnityPy.enums import ClassIDType
 from UnityPy.files import SerializedFile, BundleFile, WebFile
 from UnityPy.streams.EndianBinaryReader import EndianBinaryReader
 
-from .asset_model import AssetInfo
+from .asset_model import AssetInfo, source_lock
 
 
 # Configure logger
 log = logging.getLogger("ABVME")
 
-# Available asset types for extraction
-available_assets = [
+# Available asset types for extraction (frozenset for O(1) membership per object)
+available_assets = frozenset({
     ClassIDType.Texture2D, 
     ClassIDType.TextAsset, 
     # ClassIDType.Mesh
-]
+})
+
+# Read buffer for bundle files (4 MiB) - keeps syscall count low on large bundles
+READ_BUFFER_SIZE = 4 << 20
 
 class ABVMECore:
     """
@@ -36,6 +40,8 @@ class ABVMECore:
         self._env: Environment
         self._available_assets: list[AssetInfo] = []
         self._source_paths: list[dict[str, SerializedFile | BundleFile | WebFile | EndianBinaryReader]] = []
+        # Paths of modified loaded files, in edit order (dict used as an ordered set)
+        self._changed_paths: dict[str, None] = {}
     
     @property
     def source_paths(self) -> list[dict[str, SerializedFile | BundleFile | WebFile | EndianBinaryReader]]:
@@ -50,7 +56,8 @@ class ABVMECore:
     def load_files(
         self,
         file_list: list[str],
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        should_continue: Optional[Callable[[], bool]] = None
     ) -> list[AssetInfo]:
         """
         Load Unity bundle files from file paths
@@ -58,6 +65,8 @@ class ABVMECore:
         Args:
             file_list: List of file paths to load
             progress_callback: Optional callback function(current, total, filename) for progress updates
+            should_continue: Optional callback returning False to stop loading;
+                assets from files loaded so far are still returned
             
         Returns:
             List of AssetInfo objects extracted from bundles
@@ -65,42 +74,73 @@ class ABVMECore:
         env = Environment()
         max_try = 100
         total_files = len(file_list)
-        log.info(f"Starting to load {total_files} files...")
+        log.info("Starting to load %d files...", total_files)
         
         for idx, file in enumerate(file_list, start=1):
+            if should_continue and not should_continue():
+                log.info("Loading cancelled after %d of %d files", idx - 1, total_files)
+                break
+                
             # Emit progress before loading each file
             if progress_callback:
                 progress_callback(idx, total_files, file)
                 
             start_time = time.time()
-            with open(file, "rb") as f:
+            with open(file, "rb", buffering=READ_BUFFER_SIZE) as f:
+                # Hint the kernel to read ahead aggressively (POSIX only)
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
                 file_byte = f.read()
                 
             # Check if file has UnityFS header
             if len(file_byte) >= 8 and file_byte[:7] != b"UnityFS":
-                log.warning(f"File {file} does not have UnityFS header, skipping...")
+                log.warning("File %s does not have UnityFS header, skipping...", file)
                 continue
                 
-            current_trim = 0
-            for i in range(max_try):
-                try:
-                    if current_trim:
-                        data = file_byte[:-current_trim]
-                        env.load_file(data, name=file)
-                        log.debug(f"Trimmed {current_trim} bytes from {file}")
-                    else:
-                        env.load_file(file)
-                    break
-                except Exception as e:
-                    current_trim += 1
-                    if i == max_try - 1:
-                        log.error(f"Failed to load {file}: {e}")
+            self._load_with_trim(env, file_byte, file, max_try, should_continue)
                         
-            log.info(f"Took {time.time() - start_time:.4f} seconds to load {file}")
+            log.info("Took %.4f seconds to load %s", time.time() - start_time, file)
             
         self._env = env
         return self.get_available_assets()
 
+    @staticmethod
+    def _load_with_trim(
+        env: Environment,
+        file_byte: bytes,
+        file: str,
+        max_try: int,
+        should_continue: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """
+        Load a bundle, trimming trailing bytes one at a time until UnityPy accepts it
+        
+        Every attempt works on the bytes already read by load_files (UnityPy
+        does not re-read the file from disk), and trimmed attempts slice a
+        memoryview so retries on malformed bundles don't copy the buffer.
+        
+        Returns:
+            True if the file was loaded, False after max_try failed attempts
+            or when should_continue() returns False between attempts
+        """
+        view = memoryview(file_byte)
+        size = len(view)
+        for trim in range(max_try):
+            if trim and should_continue and not should_continue():
+                return False
+            try:
+                if trim:
+                    env.load_file(view[:size - trim], name=file)
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("Trimmed %d bytes from %s", trim, file)
+                else:
+                    env.load_file(file_byte, name=file)
+                return True
+            except Exception as e:
+                if trim == max_try - 1:
+                    log.error("Failed to load %s: %s", file, e)
+        return False
+
     def get_available_assets(self) -> list[AssetInfo]:
         """
         Extract available assets from loaded environment
@@ -115,17 +155,83 @@ class ABVMECore:
             for obj in self._env.objects:
                 if obj.type not in available_assets:
                     continue
-                # Find source path
-                source_path = ""
-                target = obj.assets_file
-                if target in bundle_file_dict:
-                    source_path = bundle_file_dict[target]
-                elif hasattr(target, "parent") and target.parent in bundle_file_dict:
-                    source_path = bundle_file_dict[target.parent]
+                source_path = self._find_source_path(obj.assets_file, bundle_file_dict)
                 assets.append(AssetInfo(obj, source_path))
                     
         return assets
 
+    @staticmethod
+    def _find_source_path(target, bundle_file_dict: dict) -> str:
+        """
+        Find the loaded file containing target by walking up its parents
+        
+        Args:
+            target: File object an object was read from
+            bundle_file_dict: Mapping of loaded file objects to their paths
+            
+        Returns:
+            Path key in loaded files, or "" if target is not inside one
+        """
+        while target is not None:
+            path = bundle_file_dict.get(target)
+            if path is not None:
+                return path
+            target = getattr(target, "parent", None)
+        return ""
+
+    def register_change(self, asset: AssetInfo):
+        """
+        Mark the loaded bundle file containing an edited asset as modified
+        
+        Args:
+            asset: Edited asset; without a source_path, the loaded file
+                containing its object is used
+        """
+        path = asset.source_path
+        if not path:
+            bundle_file_dict = {v: k for k, v in self._env.files.items()}
+            path = self._find_source_path(asset._obj.assets_file, bundle_file_dict)
+        if path:
+            self._changed_paths[path] = None
+        else:
+            log.warning("Could not find the loaded file containing %s; the edit cannot be saved", asset.name)
+
+    def mark_saved(self, paths: Iterable[str]):
+        """
+        Clear the modified mark for files that were saved
+        
+        Args:
+            paths: File path keys in loaded files
+        """
+        for path in paths:
+            self._changed_paths.pop(path, None)
+
+    def is_changed(self, path: str) -> bool:
+        """Check if a loaded bundle file has unsaved edits"""
+        return path in self._changed_paths
+
+    def changed_paths(self) -> list[str]:
+        """Get paths of modified loaded files, in edit order"""
+        return list(self._changed_paths)
+
+    def has_changes(self) -> bool:
+        """Check if any loaded bundle file has unsaved edits"""
+        return bool(self._changed_paths)
+
+    def iter_changed_files(self) -> Iterator[tuple[str, SerializedFile | BundleFile | WebFile]]:
+        """
+        Iterate over modified bundle files without scanning the whole environment
+        
+        Yields:
+            Tuples of (path, file object) for each registered change, in edit order
+        """
+        files = self._env.files
+        # Snapshot: edits on the UI thread may register changes meanwhile
+        for path in list(self._changed_paths):
+            file = files.get(path)
+            if file is not None and not isinstance(file, EndianBinaryReader):
+                yield path, file
+
     def save_all_changed_files(
         self,
         output_dir: str | Path,
@@ -143,13 +249,13 @@ class ABVMECore:
         output_dir.mkdir(parents=True, exist_ok=True)
         saved = 0
 
-        for file in self._env.files.values():
-            if not isinstance(file, EndianBinaryReader) and getattr(file, 'is_changed', False):
-                output_path = output_dir / file.name
+        for path, file in self.iter_changed_files():
+            output_path = output_dir / file.name
+            with source_lock(path):
                 self._save_fileobj(file, output_path, packer)
-                saved += 1
+            saved += 1
                 
-        log.info(f"Took {time.time() - start_time:.2f} seconds to save {saved} changed files to {output_dir}")
+        log.info("Took %.2f seconds to save %d changed files to %s", time.time() - start_time, saved, output_dir)
 
     def save_file(
         self,
@@ -171,8 +277,12 @@ class ABVMECore:
             return
 
         if not isinstance(target_file, EndianBinaryReader):
-            output_path = Path(output_path).resolve()
-            self._save_fileobj(target_file, output_path, packer)
+            output_path = Path(output_path)
+            # SaveWorker passes pre-resolved paths; only resolve relative ones
+            if not output_path.is_absolute():
+                output_path = output_path.resolve()
+            with source_lock(file):
+                self._save_fileobj(target_file, output_path, packer)
 
     def _save_fileobj(
         self, 
@@ -185,4 +295,4 @@ class ABVMECore:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, "wb") as f:
             f.write(file_obj.save(packer=packer))
-        log.info(f"Took {time.time() - start_time:.2f} seconds to save {output_path}")
\ No newline at end of file
+        log.info("Took %.2f seconds to save %s", time.time() - start_time, output_path)
\ No newline at end of file
@@ -4,11 +4,13 @@ from .loader_worker import LoaderWorker
 from .edit_worker import EditWorker
 from .logging_handler import StatusBarHandler
 from .save_worker import SaveWorker
+from .export_worker import ExportWorker
 
 __all__ = [
     "LoaderWorker",
     "EditWorker",
     "StatusBarHandler",
     "SaveWorker",
+    "ExportWorker",
 ]
 
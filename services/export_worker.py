@@ -0,0 +1,79 @@
+"""
+Export Worker - Background thread for exporting multiple assets
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from PySide6.QtCore import QThread, Signal
+
+from models import AssetInfo, ExportResult, ResultStatus
+
+
+# Upper bound on concurrent export threads
+EXPORT_MAX_WORKERS = 8
+
+
+class ExportWorker(QThread):
+    """
+    Background worker for exporting assets into one directory
+    Assets of different bundles export in parallel; AssetInfo.export holds its
+    bundle's lock, so assets of the same bundle export one after another
+    Emits finished signal with (asset, ExportResult) pairs in input order
+    """
+    progress = Signal(int, int, str)  # current, total, asset name
+    finished = Signal(object)  # list[tuple[AssetInfo, ExportResult]]
+
+    def __init__(self, assets: list[AssetInfo], output_dir: Path):
+        super().__init__()
+        self.assets = assets
+        self.output_dir = output_dir
+
+    def run(self):
+        """Execute export in background thread"""
+        assets = self.assets
+        total = len(assets)
+        names = self._unique_export_names(assets)
+        results: list[ExportResult | None] = [None] * total
+
+        bundles = len({asset.source_path for asset in assets})
+        max_workers = min(EXPORT_MAX_WORKERS, bundles, os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(asset.export, self.output_dir, name): idx
+                for idx, (asset, name) in enumerate(zip(assets, names))
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                idx = futures[future]
+                try:
+                    results[idx] = future.result()
+                except Exception as e:
+                    # e.g. an unreadable object; record it so the batch still finishes
+                    results[idx] = ExportResult(status=ResultStatus.ERROR, message=str(e))
+                self.progress.emit(done, total, assets[idx].name)
+
+        self.finished.emit(list(zip(assets, results)))
+
+    @staticmethod
+    def _unique_export_names(assets: list[AssetInfo]) -> list[str]:
+        """
+        Default export file names, made unique within the batch
+        Clashing names (compared case-insensitively, as on Windows) get the
+        asset's PathID appended, so no two exports write the same file
+        """
+        used: set[str] = set()
+        names: list[str] = []
+        for asset in assets:
+            name = asset.default_export_name()
+            if name.lower() in used:
+                stem, dot, ext = name.partition('.')
+                base = f"{stem}_{asset.path_id}"
+                name = f"{base}{dot}{ext}"
+                counter = 1
+                while name.lower() in used:
+                    name = f"{base}_{counter}{dot}{ext}"
+                    counter += 1
+            used.add(name.lower())
+            names.append(name)
+        return names
@@ -2,6 +2,9 @@
 Loader Worker - Background thread for loading bundle files
 """
 
+import os
+import stat
+
 from PySide6.QtCore import QThread, Signal
 
 from models import ABVMECore
@@ -10,10 +13,12 @@ from models import ABVMECore
 class LoaderWorker(QThread):
     """
     Background worker for loading Unity bundle files
-    Emits finished signal with list of loaded assets
+    Emits finished signal with list of loaded assets, or invalid_files
+    (and no finished) when none of the given paths is a regular file
     """
     progress = Signal(int, int, str)  # Signal: (current, total, filename) files loaded
-    finished = Signal(list)  # Signal to emit when loading is complete
+    finished = Signal(object)  # list[AssetInfo]; object skips per-item QVariant conversion
+    invalid_files = Signal(list)  # Given paths, when none of them can be loaded
     
     def __init__(self, core: ABVMECore, files: list[str]):
         super().__init__()
@@ -25,6 +30,29 @@ class LoaderWorker(QThread):
         def on_progress(current: int, total: int, filename: str):
             self.progress.emit(current, total, filename)
         
-        assets = self.core.load_files(self.files, progress_callback=on_progress)
+        # Validate paths here so the stat calls stay off the UI thread
+        valid_files = self._regular_files(self.files)
+        if not valid_files:
+            self.invalid_files.emit(self.files)
+            return
+        
+        assets = self.core.load_files(
+            valid_files,
+            progress_callback=on_progress,
+            should_continue=lambda: not self.isInterruptionRequested(),
+        )
         self.finished.emit(assets)
+        
+    @staticmethod
+    def _regular_files(paths: list[str]) -> list[str]:
+        """Filter paths down to existing regular files"""
+        valid_files = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                valid_files.append(path)
+        return valid_files
 
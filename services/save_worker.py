@@ -3,6 +3,7 @@ Save Worker - Background thread for saving bundle files
 """
 
 import logging
+import os
 from pathlib import Path
 import time
 from typing import Literal, Optional
@@ -47,7 +48,8 @@ class SaveWorker(QThread):
         """
         super().__init__()
         self.core = core
-        self.output_dir = Path(output_dir)
+        # Resolve once up front so per-file output paths are already absolute
+        self.output_dir = Path(output_dir).resolve()
         self.packer: Literal["none", "lz4", "lzma", "original"] = packer or "none"
         self.specific_file = specific_file
         self.output_filename = output_filename
@@ -71,6 +73,15 @@ class SaveWorker(QThread):
             self.error.emit(error_msg)
             self.finished.emit(False, error_msg)
     
+    def _cancelled(self, saved: int) -> bool:
+        """Check for an interruption request and report it via finished signal"""
+        if not self.isInterruptionRequested():
+            return False
+        msg = f"Save cancelled after {saved} file(s)"
+        log.info(msg)
+        self.finished.emit(False, msg)
+        return True
+
     def _save_single_file(self):
         """Save a single specific file"""
         assert self.specific_file is not None, "specific_file must be set"
@@ -109,14 +120,17 @@ class SaveWorker(QThread):
             
             # Save each file with progress updates
             saved = 0
+            output_dir = os.fspath(self.output_dir)
             for idx, filepath in enumerate(self.specific_files, 1):
-                filename = Path(filepath).name
+                if self._cancelled(saved):
+                    return
+                filename = os.path.basename(filepath)
                 
                 # Emit progress
                 self.progress.emit(idx, total, filename)
                 
                 # Save file
-                output_path = self.output_dir / filename
+                output_path = os.path.join(output_dir, filename)
                 self.core.save_file(filepath, output_path, self.packer)
                 saved += 1
             
@@ -134,11 +148,7 @@ class SaveWorker(QThread):
         try:
             start_time = time.time()
             # Get list of changed files
-            changed_files = [
-                (path, file) 
-                for path, file in self.core._env.files.items()
-                if hasattr(file, 'is_changed') and getattr(file, 'is_changed', False)
-            ]
+            changed_files = list(self.core.iter_changed_files())
             
             total = len(changed_files)
             
@@ -153,15 +163,18 @@ class SaveWorker(QThread):
             
             # Save each file with progress updates
             saved = 0
+            output_dir = os.fspath(self.output_dir)
             for idx, (path, file_obj) in enumerate(changed_files, 1):
-                filename = Path(path).name if hasattr(Path(path), 'name') else getattr(file_obj, 'name', f'file_{idx}')
+                if self._cancelled(saved):
+                    return
+                filename = os.path.basename(path) or getattr(file_obj, 'name', f'file_{idx}')
                 
                 # Emit progress
                 self.progress.emit(idx, total, filename)
                 
                 # Save file
-                output_path = self.output_dir / filename
-                self.core._save_fileobj(file_obj, output_path, self.packer)
+                output_path = os.path.join(output_dir, filename)
+                self.core.save_file(path, output_path, self.packer)
                 saved += 1
             
             success_msg = f"Successfully saved {saved} file(s)"
@@ -15,6 +15,10 @@ class FileDropWidget(QWidget):
     """
     files_dropped = Signal(list)
 
+    # Class-level defaults: type-level descriptors for the two callbacks
+    drop_handler: Optional[Callable[[list[str]], bool]] = None
+    can_accept_drop: Optional[Callable[[], bool]] = None
+
     def __init__(
         self, 
         parent=None, 
@@ -23,8 +27,10 @@ class FileDropWidget(QWidget):
     ):
         super().__init__(parent)
         self.setAcceptDrops(True)
-        self.drop_handler = drop_handler
-        self.can_accept_drop = can_accept_drop
+        if drop_handler is not None:
+            self.drop_handler = drop_handler
+        if can_accept_drop is not None:
+            self.can_accept_drop = can_accept_drop
 
     def _can_accept(self) -> bool:
         """Check if widget can currently accept drops"""
@@ -34,16 +40,18 @@ class FileDropWidget(QWidget):
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event"""
-        if not event.mimeData().hasUrls():
+        mime_data = event.mimeData()
+        if not self._can_accept() or not mime_data.hasUrls():
             event.ignore()
             return
 
-        urls = event.mimeData().urls()
-        if not any(url.isLocalFile() for url in urls):
-            event.ignore()
-            return
-
-        if not self._can_accept():
+        # Fires at cursor rate while dragging; stop at the first local file
+        has_local = False
+        for url in mime_data.urls():
+            if url.isLocalFile():
+                has_local = True
+                break
+        if not has_local:
             event.ignore()
             return
 
@@ -51,9 +59,15 @@ class FileDropWidget(QWidget):
 
     def dropEvent(self, event: QDropEvent):
         """Handle drop event"""
-        urls = event.mimeData().urls()
-        paths = [str(url.toLocalFile()) for url in urls if url.isLocalFile()]
-        if not paths or not self._can_accept():
+        if not self._can_accept():
+            event.ignore()
+            return
+
+        paths = []
+        for url in event.mimeData().urls():
+            if url.isLocalFile():
+                paths.append(url.toLocalFile())  # already str in PySide6
+        if not paths:
             event.ignore()
             return
 
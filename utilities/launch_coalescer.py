@@ -7,10 +7,50 @@ into the first one within a short collection window. Launches that arrive
 after the window closes spawn their own independent instances.
 """
 
-import json
+import struct
+import sys
 
 from PySide6.QtCore import QObject, QTimer, Signal
-from PySide6.QtNetwork import QLocalServer, QLocalSocket
+from PySide6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+
+# Wire format: <u32 payload length> header, then a payload of <u32 count>
+# followed by <u32 byte length><UTF-8 bytes> per path
+_U32 = struct.Struct("<I")
+# Upper bound on an accepted payload so a bogus header can't exhaust memory
+_MAX_PAYLOAD_SIZE = 16 * 1024 * 1024
+
+# On Linux, bind in the abstract namespace: no socket file in /tmp to
+# stat/unlink, and no stale endpoint is left behind by a crashed run
+_USE_ABSTRACT_NAMESPACE = sys.platform.startswith('linux')
+
+
+def _pack_paths(file_paths: list[str]) -> bytes:
+    """Encode a path list into a length-prefixed binary frame"""
+    parts = [_U32.pack(len(file_paths))]
+    for path in file_paths:
+        encoded = path.encode('utf-8', errors='surrogatepass')
+        parts.append(_U32.pack(len(encoded)))
+        parts.append(encoded)
+    return b"".join(parts)
+
+
+def _unpack_paths(data: bytes) -> list[str]:
+    """Decode a frame produced by _pack_paths; returns [] if malformed"""
+    try:
+        (count,) = _U32.unpack_from(data, 0)
+        offset = _U32.size
+        paths = []
+        for _ in range(count):
+            (length,) = _U32.unpack_from(data, offset)
+            offset += _U32.size
+            if offset + length > len(data):
+                return []
+            paths.append(data[offset:offset + length].decode('utf-8', errors='surrogatepass'))
+            offset += length
+        return paths
+    except (struct.error, UnicodeDecodeError):
+        return []
 
 
 class LaunchCoalescer(QObject):
@@ -27,6 +67,8 @@ class LaunchCoalescer(QObject):
         self.key = key
         self.collection_window_ms = collection_window_ms
         self.server = QLocalServer()
+        if _USE_ABSTRACT_NAMESPACE:
+            self.server.setSocketOptions(QLocalServer.SocketOption.AbstractNamespaceOption)
         self._collected: list[str] = []
         self._idle_timer = QTimer()
         self._idle_timer.setSingleShot(True)
@@ -47,14 +89,19 @@ class LaunchCoalescer(QObject):
         if self._forward_to_existing(file_paths):
             return False
 
-        # Become the collector. removeServer clears any stale endpoint left
-        # by a prior crashed run.
-        QLocalServer.removeServer(self.key)
-        if not self.server.listen(self.key):
+        # Become the collector.
+        listening = self.server.listen(self.key)
+        if not listening:
             # Lost a race against another process that just claimed the role.
             # Retry the forward — by now the winner should be listening.
             if self._forward_to_existing(file_paths):
                 return False
+            # Nobody answered, so an in-use address is a stale endpoint left
+            # by a prior crashed run. Only now is it safe to remove it.
+            if self.server.serverError() == QAbstractSocket.SocketError.AddressInUseError:
+                QLocalServer.removeServer(self.key)
+                listening = self.server.listen(self.key)
+        if not listening:
             # Couldn't forward and couldn't listen — run standalone.
             self._collected = file_paths
             QTimer.singleShot(0, lambda: self.pathsCollected.emit(self._collected))
@@ -67,13 +114,15 @@ class LaunchCoalescer(QObject):
 
     def _forward_to_existing(self, file_paths: list[str]) -> bool:
         socket = QLocalSocket()
+        if _USE_ABSTRACT_NAMESPACE:
+            socket.setSocketOptions(QLocalSocket.SocketOption.AbstractNamespaceOption)
         socket.connectToServer(self.key)
         if not socket.waitForConnected(200):
             socket.abort()
             return False
         try:
-            data = json.dumps(file_paths).encode('utf-8')
-            socket.write(data)
+            payload = _pack_paths(file_paths)
+            socket.write(_U32.pack(len(payload)) + payload)
             socket.flush()
             socket.waitForBytesWritten(500)
             socket.disconnectFromServer()
@@ -87,19 +136,43 @@ class LaunchCoalescer(QObject):
         socket = self.server.nextPendingConnection()
         if not socket:
             return
-        if socket.waitForReadyRead(500):
-            data = bytes(socket.readAll().data())
-            try:
-                paths = json.loads(data.decode('utf-8'))
-                if isinstance(paths, list):
-                    self._collected.extend(p for p in paths if isinstance(p, str))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
+        payload = self._read_payload(socket)
+        if payload is not None:
+            self._collected.extend(_unpack_paths(payload))
         socket.close()
         # Each new arrival extends the window so a steady drip of launches
         # all batch together.
         self._idle_timer.start(self.collection_window_ms)
 
+    @staticmethod
+    def _read_payload(socket: QLocalSocket, timeout_ms: int = 500) -> bytes | None:
+        """
+        Read one length-prefixed payload, looping until it has fully arrived.
+        Large path lists can be split across several reads, so a single
+        readAll() may return a truncated frame.
+
+        Returns:
+            Payload bytes, or None on timeout or an oversized header.
+        """
+        buf = bytearray()
+
+        def fill(size: int) -> bool:
+            while len(buf) < size:
+                if not socket.bytesAvailable() and not socket.waitForReadyRead(timeout_ms):
+                    return False
+                buf.extend(bytes(socket.readAll().data()))
+            return True
+
+        if not fill(_U32.size):
+            return None
+        (total,) = _U32.unpack_from(buf, 0)
+        if total > _MAX_PAYLOAD_SIZE:
+            return None
+        end = _U32.size + total
+        if not fill(end):
+            return None
+        return bytes(buf[_U32.size:end])
+
     def _finish_collection(self):
         # Stop accepting new launches into this batch — future launches will
         # find no collector and start their own instances.
@@ -4,12 +4,15 @@ Handles resource path resolution for both development and compiled (Nuitka) envi
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_base_path() -> Path:
     """
     Get the base path for resources.
+    Cached, since the result is stable for the lifetime of the process.
     
     Returns:
         Path to the application's base directory.
@@ -43,9 +46,11 @@ def get_resource_path(relative_path: str) -> Path:
     return get_base_path() / relative_path
 
 
+@lru_cache(maxsize=256)
 def get_resource_str(relative_path: str) -> str:
     """
     Get absolute path to a resource file as string.
+    Cached per relative path (resource names are a small fixed set).
     
     Args:
         relative_path: Path relative to the application's base directory
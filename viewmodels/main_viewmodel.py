@@ -4,17 +4,41 @@ Presentation logic and state management for the main window
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Optional, Literal, cast
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 from models import ABVMECore, AssetInfo, EditResult, ExportResult
-from services import LoaderWorker, EditWorker, SaveWorker
+from services import LoaderWorker, EditWorker, SaveWorker, ExportWorker
 
 
 log = logging.getLogger("ABVME")
 
+# Number of assets handed to the view per event-loop pass after loading
+ASSET_BATCH_SIZE = 1000
+
+# Max asset names listed in bulk export summary log lines
+EXPORT_LOG_NAME_LIMIT = 10
+
+
+def _summarize_names(names: list[str]) -> str:
+    """Join the first few names for a summary log line"""
+    shown = ", ".join(names[:EXPORT_LOG_NAME_LIMIT])
+    return shown + ("..." if len(names) > EXPORT_LOG_NAME_LIMIT else "")
+
+# Log level for an operation result, indexed by success flag
+_RESULT_LEVELS = (logging.ERROR, logging.INFO)
+
+# Per-type lookup tables, keyed by ClassIDType name
+_SUGGESTED_EXT = {"Texture2D": ".png", "TextAsset": ".txt"}
+_EDIT_FILTERS = {
+    "Texture2D": "Image Files (*.png *.jpg *.jpeg *.bmp *.tga *.dds);;All Files (*.*)",
+    "TextAsset": "All Files (*.*)",
+}
+_EDITABLE_TYPES = frozenset(_EDIT_FILTERS)
+
 
 class MainViewModel(QObject):
     """
@@ -24,7 +48,8 @@ class MainViewModel(QObject):
     """
     
     # Signals for data binding with View
-    assets_loaded = Signal(list)  # List of AssetInfo
+    assets_batch_loaded = Signal(object)  # Next chunk of loaded AssetInfo (list, passed by reference)
+    assets_load_finished = Signal(int)  # Total number of assets delivered
     loading_started = Signal(str)  # Status message
     loading_progress = Signal(int, int, str)  # (current, total, filename) files loaded
     loading_finished = Signal(str)  # Status message
@@ -32,7 +57,10 @@ class MainViewModel(QObject):
     edit_started = Signal(str)  # Status message
     edit_finished = Signal(object, object)  # asset, result
     
+    export_started = Signal(str)  # Status message
+    export_progress = Signal(int, int, str)  # current, total, asset name
     export_completed = Signal(str, int)  # Message, log level
+    export_finished = Signal(int, int)  # successful, total (multi-asset export)
     
     save_started = Signal(str)  # Status message
     save_progress = Signal(int, int, str)  # current, total, filename
@@ -48,10 +76,32 @@ class MainViewModel(QObject):
         self.assets: list[AssetInfo] = []
         self.selected_assets: list[AssetInfo] = []
         
+        # Coalesce bursts of selection updates (e.g. range-select drags)
+        # into one selection_changed emission per event-loop pass
+        self._pending_selection: Optional[list[AssetInfo]] = None
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self._flush_selection)
+        
         # Background workers
         self.loader_worker: Optional[LoaderWorker] = None
         self.edit_worker: Optional[EditWorker] = None
         self.save_worker: Optional[SaveWorker] = None
+        self.export_worker: Optional[ExportWorker] = None
+        
+        # Source files handed to the running save (unsaved edits are tracked by core)
+        self._saving_paths: set[str] = set()
+        
+        # Bumped whenever loaded files or their change state may differ,
+        # so get_source_files can reuse its last scan in between
+        self._files_dirty_version = 0
+        self._source_files_cache: Optional[tuple[int, list[tuple[str, str, str, bool]]]] = None
+        
+        # Batched delivery of loaded assets; generation drops stale batches
+        self._pending_assets: list[AssetInfo] = []
+        self._batch_index = 0
+        self._batch_generation = 0
         
     def load_files_from_paths(self, file_paths: list[str]):
         """
@@ -60,19 +110,27 @@ class MainViewModel(QObject):
         Args:
             file_paths: List of file paths to load
         """
+        self._batch_generation += 1  # Stop delivering batches from a previous load
         self.loading_started.emit("Loading bundle files...")
         
-        valid_files = [path for path in file_paths if Path(path).is_file()]
-        if not valid_files:
-            self.status_message.emit("No valid bundle files were provided.", logging.WARNING)
-            return
-        
-        # Create worker thread
-        self.loader_worker = LoaderWorker(ABVMECore(), valid_files)
+        # Create worker thread (it also filters out non-file paths)
+        self.loader_worker = LoaderWorker(ABVMECore(), file_paths)
         self.loader_worker.progress.connect(self._on_loading_progress)
         self.loader_worker.finished.connect(self._on_loading_complete)
+        self.loader_worker.invalid_files.connect(self._on_invalid_files)
         self.loader_worker.start()
         
+    def _on_invalid_files(self, file_paths: list[str]):
+        """Handle a load request where no path was a loadable file"""
+        message = "No valid bundle files were provided."
+        self.loading_finished.emit(message)
+        self.status_message.emit(message, logging.WARNING)
+        
+    def cancel_loading(self):
+        """Request the running loader to stop after the current file"""
+        if self.loader_worker and self.loader_worker.isRunning():
+            self.loader_worker.requestInterruption()
+        
     def _on_loading_progress(self, current: int, total: int, filename: str):
         """Handle loading progress update"""
         self.loading_progress.emit(current, total, filename)
@@ -81,12 +139,41 @@ class MainViewModel(QObject):
         """Handle loading completion"""
         self.assets = assets
         self.core = self.loader_worker.core if self.loader_worker else None
+        self._files_dirty_version += 1
         
-        self.loading_finished.emit(f"Loaded {len(assets)} assets.")
-        self.assets_loaded.emit(assets)
+        cancelled = self.loader_worker is not None and self.loader_worker.isInterruptionRequested()
+        if cancelled:
+            self.loading_finished.emit(f"Loading cancelled. Loaded {len(assets)} assets.")
+        else:
+            self.loading_finished.emit(f"Loaded {len(assets)} assets.")
+        
+        # Hand assets to the view in chunks so the UI thread stays responsive
+        self._batch_generation += 1
+        self._pending_assets = assets
+        self._batch_index = 0
+        generation = self._batch_generation
+        QTimer.singleShot(0, lambda: self._emit_next_batch(generation))
         
         log.info(f"Successfully loaded: {len(self.core.source_paths) if self.core else 0} files.")
         
+    def _emit_next_batch(self, generation: int):
+        """Emit the next chunk of loaded assets and reschedule until done"""
+        if generation != self._batch_generation:
+            return
+        
+        start = self._batch_index
+        batch = self._pending_assets[start:start + ASSET_BATCH_SIZE]
+        self._batch_index = start + len(batch)
+        if batch:
+            self.assets_batch_loaded.emit(batch)
+        
+        if self._batch_index < len(self._pending_assets):
+            QTimer.singleShot(0, lambda: self._emit_next_batch(generation))
+        else:
+            total = len(self._pending_assets)
+            self._pending_assets = []
+            self.assets_load_finished.emit(total)
+        
     def update_selection(self, selected_assets: list[AssetInfo]):
         """
         Update current selection
@@ -94,21 +181,38 @@ class MainViewModel(QObject):
         Args:
             selected_assets: List of selected AssetInfo objects
         """
-        self.selected_assets = selected_assets
-        self.selection_changed.emit(len(selected_assets))
+        self._pending_selection = selected_assets
+        self._selection_timer.start()
+        
+    def _flush_selection(self):
+        """Commit a pending selection update and notify listeners"""
+        if self._pending_selection is None:
+            return
+        self._selection_timer.stop()
+        self.selected_assets = self._pending_selection
+        self._pending_selection = None
+        self.selection_changed.emit(len(self.selected_assets))
+        
+    def get_selected_assets(self) -> list[AssetInfo]:
+        """Get selected assets, including a selection update still pending"""
+        self._flush_selection()
+        return self.selected_assets
         
     def get_single_selected_asset(self) -> Optional[AssetInfo]:
         """Get single selected asset if exactly one is selected"""
+        self._flush_selection()
         if len(self.selected_assets) == 1:
             return self.selected_assets[0]
         return None
         
     def can_edit_asset(self) -> bool:
         """Check if editing is possible (exactly one asset selected)"""
+        self._flush_selection()
         return len(self.selected_assets) == 1
         
     def can_export_assets(self) -> bool:
         """Check if export is possible (at least one asset selected)"""
+        self._flush_selection()
         return len(self.selected_assets) > 0
         
     def edit_asset(self, asset: AssetInfo, source_path: str) -> bool:
@@ -142,11 +246,16 @@ class MainViewModel(QObject):
             self.edit_finished.emit(None, None)
             return
 
-        level = logging.INFO if result.is_success else logging.ERROR
+        level = _RESULT_LEVELS[result.is_success]
         message = result.message or (
             f"Edited {asset.name}" if result.is_success else f"Failed to edit {asset.name}"
         )
         
+        if result.is_success:
+            self._files_dirty_version += 1
+            if self.core:
+                self.core.register_change(asset)
+        
         self.status_message.emit(message, level)
         self.edit_finished.emit(asset, result)
         
@@ -168,7 +277,7 @@ class MainViewModel(QObject):
         """
         result = asset.export(output_path.parent, output_path.name)
         
-        level = logging.INFO if result.is_success else logging.ERROR
+        level = _RESULT_LEVELS[result.is_success]
         message = result.message or (
             "Export completed" if result.is_success else "Export failed"
         )
@@ -182,27 +291,55 @@ class MainViewModel(QObject):
             
         return result
         
-    def export_multiple_assets(self, assets: list[AssetInfo], output_dir: Path) -> tuple[int, int]:
+    def export_multiple_assets(self, assets: list[AssetInfo], output_dir: Path) -> bool:
         """
-        Export multiple assets to directory
+        Export multiple assets to directory in the background
+        Progress is reported by export_progress, the outcome by
+        export_completed and export_finished
         
         Args:
             assets: List of assets to export
             output_dir: Output directory path
             
         Returns:
-            Tuple of (successful_count, total_count)
+            True if export started successfully, False otherwise
         """
-        successes = 0
-        total = len(assets)
+        if self.export_worker and self.export_worker.isRunning():
+            self.status_message.emit("Another export is currently running.", logging.WARNING)
+            return False
         
-        for asset in assets:
-            result = asset.export(output_dir)
+        self.export_started.emit(f"Exporting {len(assets)} assets...")
+        self.export_worker = ExportWorker(list(assets), output_dir)
+        self.export_worker.progress.connect(self.export_progress.emit)
+        self.export_worker.finished.connect(self._on_export_finished)
+        self.export_worker.start()
+        return True
+        
+    def _on_export_finished(self, results: list[tuple[AssetInfo, ExportResult]]):
+        """Handle multi-asset export completion"""
+        output_dir = self.export_worker.output_dir if self.export_worker else ""
+        total = len(results)
+        successes = 0
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        successful_names: list[str] = []
+        failed_names: list[str] = []
+        for asset, result in results:
             if result.is_success:
                 successes += 1
-                log.info(result.message or f"Exported {asset.name}")
+                successful_names.append(asset.name)
+                if debug_enabled:
+                    log.debug("Exported %s: %s", asset.name, result.message)
             else:
-                log.error(f"Failed to export {asset.name}: {result.message}")
+                failed_names.append(f"{asset.name} ({result.message})")
+        
+        # One summary line per outcome instead of one record per asset
+        if successful_names:
+            log.info("Exported %d assets: %s", successes, _summarize_names(successful_names))
+        if failed_names:
+            log.error("Failed to export %d assets: %s", len(failed_names), _summarize_names(failed_names))
+            # The summary is capped; keep every failure reachable for diagnosis
+            if debug_enabled and len(failed_names) > EXPORT_LOG_NAME_LIMIT:
+                log.debug("All failed exports:\n%s", "\n".join(failed_names))
 
         # Determine message and level
         if successes == total:
@@ -216,7 +353,7 @@ class MainViewModel(QObject):
             level = logging.ERROR
 
         self.export_completed.emit(message, level)
-        return successes, total
+        self.export_finished.emit(successes, total)
         
     def get_suggested_export_filename(self, asset: AssetInfo) -> str:
         """
@@ -228,17 +365,17 @@ class MainViewModel(QObject):
         Returns:
             Suggested filename string
         """
-        if asset.name and Path(asset.name).suffix:
-            return asset.name
-        elif asset.container:
-            return Path(asset.container).name
-        else:
-            suggested_name = f"{asset.name}_{asset.path_id}"
-            if asset.obj_type.name == "Texture2D":
-                suggested_name += ".png"
-            elif asset.obj_type.name == "TextAsset":
-                suggested_name += ".txt"
-            return suggested_name
+        # Plain string ops; no PurePath needed for a suffix/basename check
+        name = asset.name
+        if name and os.path.splitext(name)[1]:
+            return name
+        # Trailing separators are dropped so "a/b/" yields "b", as Path(...).name did
+        container = asset.container.rstrip('/\\')
+        if container:
+            idx = max(container.rfind('/'), container.rfind('\\'))
+            return container[idx + 1:]
+        type_name = asset.obj_type.name
+        return f"{name}_{asset.path_id}{_SUGGESTED_EXT.get(type_name, '')}"
             
     def get_edit_file_filter(self, asset: AssetInfo) -> Optional[str]:
         """
@@ -250,44 +387,45 @@ class MainViewModel(QObject):
         Returns:
             Filter string or None if editing not supported
         """
-        if asset.obj_type.name == "Texture2D":
-            return "Image Files (*.png *.jpg *.jpeg *.bmp *.tga *.dds);;All Files (*.*)"
-        elif asset.obj_type.name == "TextAsset":
-            return "All Files (*.*)"
-        return None
+        return _EDIT_FILTERS.get(asset.obj_type.name)
         
     def is_editing_supported(self, asset: AssetInfo) -> bool:
         """Check if editing is supported for asset type"""
-        return asset.obj_type.name in ["Texture2D", "TextAsset"]
+        return asset.obj_type.name in _EDITABLE_TYPES
         
     # ===== Save Operations =====
     
-    def get_source_files(self) -> list[tuple[str, bool]]:
+    def get_source_files(self) -> list[tuple[str, str, str, bool]]:
         """
-        Get list of source files with their change status
+        Get list of source files with their display text and change status
         
         Returns:
-            List of tuples (filepath, is_changed)
+            List of tuples (filepath, display_text, tooltip, is_changed)
         """
         if not self.core or not hasattr(self.core, '_env'):
             return []
         
-        files = []
-        for path, file_obj in self.core._env.files.items():
-            is_changed = hasattr(file_obj, 'is_changed') and file_obj.is_changed  # type: ignore
-            files.append((path, is_changed))
+        cache = self._source_files_cache
+        if cache and cache[0] == self._files_dirty_version:
+            return list(cache[1])
         
-        return files
+        is_changed = self.core.is_changed
+        files = []
+        for path in self.core._env.files:
+            name = os.path.basename(path)
+            if is_changed(path):
+                files.append((path, f"{name} *", f"{path} (modified)", True))
+            else:
+                files.append((path, name, path, False))
+        self._source_files_cache = (self._files_dirty_version, files)
+        return list(files)
         
     def has_changed_files(self) -> bool:
         """Check if there are any changed files"""
         if not self.core or not hasattr(self.core, '_env'):
             return False
         
-        for file_obj in self.core._env.files.values():
-            if hasattr(file_obj, 'is_changed') and file_obj.is_changed:  # type: ignore
-                return True
-        return False
+        return self.core.has_changes()
         
     def save_all_files(self, output_dir: Path, packer: Literal["none", "lz4", "lzma", "original"] = "none"):
         """
@@ -310,6 +448,7 @@ class MainViewModel(QObject):
             return False
 
         self.save_started.emit("Saving all changed files...")
+        self._saving_paths = set(self.core.changed_paths())
         self.save_worker = SaveWorker(self.core, output_dir, packer)
         self.save_worker.progress.connect(self._on_save_progress)
         self.save_worker.finished.connect(self._on_save_finished)
@@ -346,6 +485,7 @@ class MainViewModel(QObject):
         self.save_started.emit(f"Saving {display_name}...")
         
         # Create SaveWorker with custom output filename
+        self._saving_paths = {filepath}
         self.save_worker = SaveWorker(self.core, output_dir, packer, filepath, output_filename)
         self.save_worker.progress.connect(self._on_save_progress)
         self.save_worker.finished.connect(self._on_save_finished)
@@ -383,6 +523,7 @@ class MainViewModel(QObject):
         self.save_started.emit(f"Saving {len(filepaths)} selected file(s)...")
         
         # Create SaveWorker with specific_files list
+        self._saving_paths = set(filepaths)
         self.save_worker = SaveWorker(self.core, output_dir, packer, specific_files=filepaths)
         self.save_worker.progress.connect(self._on_save_progress)
         self.save_worker.finished.connect(self._on_save_finished)
@@ -390,13 +531,23 @@ class MainViewModel(QObject):
         self.save_worker.start()
         return True
         
+    def cancel_save(self):
+        """Request the running save to stop before the next file"""
+        if self.save_worker and self.save_worker.isRunning():
+            self.save_worker.requestInterruption()
+        
     def _on_save_progress(self, current: int, total: int, filename: str):
         """Handle save progress updates"""
         self.save_progress.emit(current, total, filename)
         
     def _on_save_finished(self, success: bool, message: str):
         """Handle save completion"""
-        level = logging.INFO if success else logging.ERROR
+        level = _RESULT_LEVELS[success]
+        if success and self._saving_paths:
+            if self.core:
+                self.core.mark_saved(self._saving_paths)
+            self._files_dirty_version += 1
+        self._saving_paths = set()
         self.save_finished.emit(success, message)
         self.status_message.emit(message, level)
         
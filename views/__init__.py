@@ -1,10 +1,5 @@
 """Views package - UI components"""
 
-from .asset_table_widget import AssetTableWidget
-from .preview_panel_widget import PreviewPanelWidget
-from .main_window import ABVMEMainWindow
-from .save_dialog import SaveDialog
-
 __all__ = [
     "AssetTableWidget",
     "PreviewPanelWidget",
@@ -12,3 +7,19 @@ __all__ = [
     "SaveDialog",
 ]
 
+
+def __getattr__(name: str):
+    """Import view classes on first access (PEP 562) to keep package import cheap"""
+    if name == "AssetTableWidget":
+        from .asset_table_widget import AssetTableWidget
+        return AssetTableWidget
+    if name == "PreviewPanelWidget":
+        from .preview_panel_widget import PreviewPanelWidget
+        return PreviewPanelWidget
+    if name == "ABVMEMainWindow":
+        from .main_window import ABVMEMainWindow
+        return ABVMEMainWindow
+    if name == "SaveDialog":
+        from .save_dialog import SaveDialog
+        return SaveDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,26 +2,92 @@
 Asset Table Widget - View component for displaying asset list
 """
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView
+    QApplication, QWidget, QVBoxLayout, QTableView, QHeaderView, QStyle, QStyledItemDelegate,
+    QStyleOptionViewItem
 )
 
 from views.components.custom_filter_header import FilterHeader
+from views.components.asset_table_model import AssetTableModel, AssetFilterProxy
 from models import AssetInfo
 
+# Quiet period before a burst of filter edits is applied
+FILTER_DEBOUNCE_MS = 80
+# Fixed height of table rows (cells hold one unwrapped line of text)
+ROW_HEIGHT = 24
+
+
+class _PlainTextDelegate(QStyledItemDelegate):
+    """
+    Delegate painting a cell's display text only
+    The default delegate queries a dozen item roles per painted cell; every cell
+    here is a single line of plain text, so only DisplayRole is read and the
+    style draws the item (keeping stylesheet ::item colours)
+    """
+    TEXT_FLAGS = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+    
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        opt.text = index.data()
+        opt.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+        opt.displayAlignment = self.TEXT_FLAGS
+        widget = opt.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+
+class _RowPrepSignals(QObject):
+    """Signals for _RowPrepTask (QRunnable cannot own signals)"""
+    done = Signal(int, object, object)  # (generation, assets, PreparedRows)
+
+
+class _RowPrepTask(QRunnable):
+    """Builds a batch's row text off the UI thread"""
+    
+    def __init__(self, generation: int, assets: list[AssetInfo]):
+        super().__init__()
+        self.generation = generation
+        self.assets = assets
+        self.signals = _RowPrepSignals()
+        
+    def run(self):
+        prepared = AssetTableModel.prepare_rows(self.assets)
+        self.signals.done.emit(self.generation, self.assets, prepared)
+
 
 class AssetTableWidget(QWidget):
     """
     Widget for displaying asset list in a table with filtering
-    Encapsulates QTableWidget with FilterHeader
+    Encapsulates QTableView over AssetTableModel with FilterHeader
     """
     # Signals
-    selection_changed = Signal(list)  # List of selected AssetInfo objects
+    selection_changed = Signal(object)  # List of selected AssetInfo objects (passed by reference)
     filter_changed = Signal()
     
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
+        # Filter values accumulated across append_assets batches
+        # (dicts used as insertion-ordered sets)
+        self._all_types: dict[str, None] = {}
+        self._all_sources: dict[str, None] = {}
+        # Values the header filter boxes were last built from
+        self._last_types: frozenset[str] = frozenset()
+        self._last_sources: frozenset[str] = frozenset()
+        # Coalesces per-keystroke filter edits into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.filter_changed.emit)
+        # Row text is prepared on a single worker so batches commit in order;
+        # generation drops batches prepared before the last clear_table
+        self._prep_generation = 0
+        self._prep_pool = QThreadPool(self)
+        self._prep_pool.setMaxThreadCount(1)
+        self._prep_pending = 0
+        self._finish_requested = False
+        # Source rows of the last emitted selection
+        self._last_selected_rows: frozenset[int] = frozenset()
         self._setup_ui()
         self._connect_signals()
         
@@ -30,10 +96,13 @@ class AssetTableWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Name", "Type", "PathID", "Container", "SourceFile"])
+        # Create model, filter proxy and table
+        self._model = AssetTableModel(self)
+        self._proxy = AssetFilterProxy(self)
+        self._proxy.setSourceModel(self._model)
+        self.table = QTableView()
+        self.table.setModel(self._proxy)
+        self.table.setItemDelegate(_PlainTextDelegate(self.table))
         
         # Replace default header with FilterHeader
         self.header = FilterHeader(self.table)
@@ -44,17 +113,19 @@ class AssetTableWidget(QWidget):
         self.table.verticalHeader().setVisible(False)
         
         # Configure table behavior
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.setVerticalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        self.table.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+        self.table.setHorizontalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
         self.table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         self.table.verticalScrollBar().setSingleStep(10)
         self.table.horizontalScrollBar().setSingleStep(20)
-        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        # self.table.setStyleSheet("QTableWidget::item { padding-top: 5px; padding-bottom: 5px; }")
+        # Fixed rows: ResizeToContents measures every inserted row
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        # self.table.setStyleSheet("QTableView::item { padding-top: 5px; padding-bottom: 5px; }")
         self.table.setAlternatingRowColors(True)
         self.table.setSortingEnabled(True)
         self.table.setWordWrap(False)
@@ -63,28 +134,33 @@ class AssetTableWidget(QWidget):
         
     def _connect_signals(self):
         """Connect internal signals"""
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self.header.filter_changed.connect(self._on_filter_changed)
         
     def _on_selection_changed(self):
         """Handle selection changes"""
-        selected_assets = self.get_selected_assets()
-        self.selection_changed.emit(selected_assets)
+        # Source rows are stable across sorting and filtering, unlike view rows
+        map_to_source = self._proxy.mapToSource
+        rows = frozenset(
+            map_to_source(index).row() for index in self.table.selectionModel().selectedRows()
+        )
+        if rows == self._last_selected_rows:
+            return
+        self._last_selected_rows = rows
+        self.selection_changed.emit(self.get_selected_assets())
         
     def _on_filter_changed(self):
         """Handle filter changes"""
-        self.filter_changed.emit()
+        self._filter_timer.start()
         
     def get_selected_assets(self) -> list[AssetInfo]:
         """Get list of currently selected assets"""
-        selected_rows = self.table.selectionModel().selectedRows()
-        assets: list[AssetInfo] = []
-        for index in selected_rows:
-            item = self.table.item(index.row(), 0)
-            asset = item.data(Qt.ItemDataRole.UserRole) if item else None
-            if asset and isinstance(asset, AssetInfo):
-                assets.append(asset)
-        return assets
+        # selectedRows() indexes point at the Name column, whose UserRole is the asset
+        user_role = Qt.ItemDataRole.UserRole
+        return [
+            asset for index in self.table.selectionModel().selectedRows()
+            if isinstance(asset := index.data(user_role), AssetInfo)
+        ]
         
     def clear_selection(self):
         """Clear table selection"""
@@ -96,88 +172,97 @@ class AssetTableWidget(QWidget):
         
     def clear_table(self):
         """Clear table"""
-        self.table.setRowCount(0)
-        self.table.clearSelection()
-        self.table.viewport().update()
+        self._prep_generation += 1
+        self._prep_pending = 0
+        self._finish_requested = False
+        # Clear selection quietly before the reset (which drops it without
+        # notifying), then report the empty selection once the table is empty
+        had_selection = bool(self._last_selected_rows)
+        selection_model = self.table.selectionModel()
+        selection_model.blockSignals(True)
+        try:
+            self.table.clearSelection()
+            self._model.clear()
+        finally:
+            selection_model.blockSignals(False)
+        self._last_selected_rows = frozenset()
+        self._all_types.clear()
+        self._all_sources.clear()
+        if had_selection:
+            self.selection_changed.emit([])
         
-    def load_assets(self, assets: list[AssetInfo]):
+    def append_assets(self, assets: list[AssetInfo]):
         """
-        Load assets into table
+        Append a batch of assets to the table
+        Row text is prepared on a worker thread; rows appear once it is committed
+        Call finish_loading() once all batches have been appended
         
         Args:
             assets: List of AssetInfo objects to display
         """
-        # Prepare for loading
+        if not assets:
+            return
+        # Keep the proxy from re-sorting after every batch; the view's sorting
+        # flag alone does not stop a proxy that was already sorted
         self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(assets))
-        self.table.clearSelection()
+        self._proxy.setDynamicSortFilter(False)
         
-        all_types = set()
-        all_sources = set()
+        self._all_types.update(dict.fromkeys(asset.obj_type.name for asset in assets))
+        self._all_sources.update(dict.fromkeys(asset.source_path for asset in assets))
         
-        for row, asset in enumerate(assets):
-            all_types.add(asset.obj_type.name)
-            all_sources.add(asset.source_path)
-            
-            # Name (Column 0) - Store AssetInfo in UserRole
-            name_item = QTableWidgetItem()
-            name_item.setToolTip(asset.name or "")
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            name_item.setData(Qt.ItemDataRole.UserRole, asset)
-            self.table.setItem(row, 0, name_item)
-            self._apply_changed_style(row, asset)
-            
-            # Type (Column 1)
-            type_item = QTableWidgetItem(asset.obj_type.name)
-            type_item.setToolTip(asset.obj_type.name)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 1, type_item)
-            
-            # PathID (Column 2)
-            path_id_item = QTableWidgetItem(asset.path_id)
-            path_id_item.setToolTip(asset.path_id)
-            path_id_item.setFlags(path_id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 2, path_id_item)
-            
-            # Container (Column 3)
-            container_item = QTableWidgetItem(asset.container)
-            container_item.setToolTip(asset.container)
-            container_item.setFlags(container_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 3, container_item)
-            
-            # SourceFile (Column 4)
-            from pathlib import Path
-            source_item = QTableWidgetItem(str(Path(asset.source_path).name))
-            source_item.setToolTip(asset.source_path)
-            source_item.setData(Qt.ItemDataRole.UserRole, asset.source_path)
-            source_item.setFlags(source_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 4, source_item)
-        
-        # Setup filter boxes for Type and SourceFile columns
-        self.header.set_filter_boxes(1, list(all_types))
-        self.header.set_filter_boxes(4, list(all_sources))
-        
-        # Adjust column widths
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        # self.table.resizeColumnsToContents()
-        self.table.setSortingEnabled(True)
+        task = _RowPrepTask(self._prep_generation, assets)
+        task.signals.done.connect(self._on_rows_prepared)
+        self._prep_pending += 1
+        self._prep_pool.start(task)
+        
+    def _on_rows_prepared(self, generation: int, assets: list[AssetInfo], prepared):
+        """Commit a prepared batch to the model on the UI thread"""
+        if generation != self._prep_generation:
+            return
+        self._prep_pending -= 1
+        
+        # Repaint once after the whole batch instead of per inserted row
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._model.append_assets(assets, prepared)
+        finally:
+            self.table.setUpdatesEnabled(True)
         
-    def _apply_changed_style(self, row: int, asset: AssetInfo):
-        """Apply visual indicator for changed assets"""
-        item = self.table.item(row, 0)
-        if not item:
+        if self._finish_requested and not self._prep_pending:
+            self._finish_requested = False
+            self.finish_loading()
+        
+    def finish_loading(self):
+        """Finalize table after all asset batches were appended"""
+        if self._prep_pending:
+            # Runs again once the last prepared batch is committed
+            self._finish_requested = True
             return
-        suffix = " *" if bool(getattr(asset, "is_changed", False)) else "   "
-        base_name = asset.name or ""
-        item.setText(f"{base_name}{suffix}")
+        
+        self.table.setUpdatesEnabled(False)
+        try:
+            # Setup filter boxes for Type and SourceFile columns, unless a reload
+            # produced the same values
+            types = frozenset(self._all_types)
+            if types != self._last_types:
+                self.header.set_filter_boxes(1, list(self._all_types))
+                self._last_types = types
+            sources = frozenset(self._all_sources)
+            if sources != self._last_sources:
+                self.header.set_filter_boxes(4, list(self._all_sources))
+                self._last_sources = sources
+            
+            # Keep the widths laid out by Stretch and let the user resize from there;
+            # resizeColumnsToContents() would measure every row's text
+            self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+            self._proxy.setDynamicSortFilter(True)
+            self.table.setSortingEnabled(True)
+        finally:
+            self.table.setUpdatesEnabled(True)
         
     def refresh_asset_display(self, asset: AssetInfo):
         """Refresh display for a specific asset"""
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.data(Qt.ItemDataRole.UserRole) is asset:
-                self._apply_changed_style(row, asset)
-                break
+        self._model.refresh_asset(asset)
                 
     def apply_filter(self, clear: bool = False):
         """
@@ -187,51 +272,8 @@ class AssetTableWidget(QWidget):
             clear: If True, clear all filters first
         """
         if clear:
+            self._filter_timer.stop()
             self.header.active_filters.clear()
             self.header.viewport().update()
         
-        active_filters = self.header.active_filters
-        
-        for row in range(self.table.rowCount()):
-            should_show = True
-            
-            for col, val in active_filters.items():
-                item = self.table.item(row, col)
-                if not item:
-                    should_show = False
-                    break
-                
-                cell_text = item.text()
-
-                # Check filter type
-                if isinstance(val, list):
-                    # Checkbox filter
-                    if not val:
-                        should_show = False
-                        break
-                    
-                    item_data = item.data(Qt.ItemDataRole.UserRole)
-                    check_val = item_data if item_data is not None else cell_text
-                        
-                    if check_val not in val:
-                        should_show = False
-                        break
-                        
-                elif isinstance(val, tuple):
-                    # Text search filter
-                    filter_text, use_match_case = val
-                    
-                    if not filter_text:
-                        continue
-                    
-                    if use_match_case:
-                        if filter_text not in cell_text:
-                            should_show = False
-                            break
-                    else:
-                        if filter_text.lower() not in cell_text.lower():
-                            should_show = False
-                            break
-                            
-            self.table.setRowHidden(row, not should_show)
-
+        self._proxy.set_filters(self.header.active_filters)
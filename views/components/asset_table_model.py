@@ -0,0 +1,295 @@
+"""
+Asset Table Model - Item model backing the asset table view
+"""
+
+from os.path import basename
+
+from PySide6.QtCore import (
+    QAbstractTableModel, QModelIndex, QPersistentModelIndex,
+    QSortFilterProxyModel, Qt
+)
+
+from models import AssetInfo
+
+COLUMN_LABELS = ("Name", "Type", "PathID", "Container", "SourceFile")
+
+_ModelIndex = QModelIndex | QPersistentModelIndex
+
+Columns = list[list[str]]  # Column-major cell text, one list per column
+PreparedRows = tuple[Columns, Columns]  # (display text, lowercase text)
+
+NON_EDIT_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+
+class AssetTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of AssetInfo objects
+    Cell text is snapshotted into per-column lists when assets are added, so
+    neither painting nor filtering has to rebuild it, and filters can sweep a
+    whole column at once
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._assets: list[AssetInfo] = []
+        self._columns: Columns = [[] for _ in COLUMN_LABELS]
+        self._columns_lower: Columns = [[] for _ in COLUMN_LABELS]
+        self._row_index: dict[int, int] = {}  # id(asset) -> source row
+
+    # ===== QAbstractTableModel interface =====
+
+    def rowCount(self, parent: _ModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._assets)
+
+    def columnCount(self, parent: _ModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(COLUMN_LABELS)
+
+    def data(self, index: _ModelIndex, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[col][row]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.cell_tooltip(self._assets[row], col, self._columns[col][row])
+        if role == Qt.ItemDataRole.UserRole:
+            return self.cell_user_data(self._assets[row], col)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < len(COLUMN_LABELS)):
+            return COLUMN_LABELS[section]
+        return None
+
+    def flags(self, index: _ModelIndex) -> Qt.ItemFlag:  # type: ignore[override]
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return NON_EDIT_FLAGS
+
+    # ===== Cell values =====
+
+    @staticmethod
+    def name_text(asset: AssetInfo) -> str:
+        """Display text of the Name cell, with the changed marker"""
+        suffix = " *" if asset.is_changed else "   "
+        return f"{asset.name}{suffix}"
+
+    @staticmethod
+    def cell_tooltip(asset: AssetInfo, col: int, text: str) -> str:
+        """Tooltip text of a cell"""
+        if col == 0:
+            return asset.name
+        if col == 4:
+            return asset.source_path
+        return text
+
+    @staticmethod
+    def cell_user_data(asset: AssetInfo, col: int):
+        """UserRole data of a cell (the asset itself on Name, full path on SourceFile)"""
+        if col == 0:
+            return asset
+        if col == 4:
+            return asset.source_path
+        return None
+
+    # ===== Content management =====
+
+    def asset_at(self, row: int) -> AssetInfo:
+        """Get asset stored at a source row"""
+        return self._assets[row]
+
+    def cell_text(self, row: int, col: int) -> str:
+        """Get cached display text of a cell"""
+        return self._columns[col][row]
+
+    def cell_text_lower(self, row: int, col: int) -> str:
+        """Get cached lowercase display text of a cell"""
+        return self._columns_lower[col][row]
+
+    def column_text(self, col: int) -> list[str]:
+        """Get cached display text of a whole column (not to be modified)"""
+        return self._columns[col]
+
+    def column_text_lower(self, col: int) -> list[str]:
+        """Get cached lowercase display text of a whole column (not to be modified)"""
+        return self._columns_lower[col]
+
+    def column_filter_keys(self, col: int) -> list:
+        """Values checkbox filters compare against: UserRole data, else display text"""
+        if col == 0:
+            return self._assets
+        if col == 4:
+            return [asset.source_path for asset in self._assets]
+        return self._columns[col]
+
+    def clear(self):
+        """Remove all assets"""
+        self.beginResetModel()
+        self._assets = []
+        self._columns = [[] for _ in COLUMN_LABELS]
+        self._columns_lower = [[] for _ in COLUMN_LABELS]
+        self._row_index = {}
+        self.endResetModel()
+
+    @staticmethod
+    def prepare_rows(assets: list[AssetInfo]) -> PreparedRows:
+        """
+        Build the cached text of rows for assets
+        Touches no Qt objects, so it may run on a worker thread
+
+        Args:
+            assets: List of AssetInfo objects
+
+        Returns:
+            Column-major display text and lowercase text, for append_assets
+        """
+        name_text = AssetTableModel.name_text
+        columns = [
+            [name_text(asset) for asset in assets],
+            [asset.obj_type.name for asset in assets],
+            [asset.path_id for asset in assets],
+            [asset.container for asset in assets],
+            [basename(asset.source_path) for asset in assets],
+        ]
+        columns_lower = [[text.lower() for text in column] for column in columns]
+        return columns, columns_lower
+
+    def append_assets(self, assets: list[AssetInfo], prepared: PreparedRows | None = None):
+        """
+        Append assets to the end of the model
+
+        Args:
+            assets: List of AssetInfo objects to append
+            prepared: Result of prepare_rows(assets), built here when omitted
+        """
+        if not assets:
+            return
+        columns, columns_lower = prepared or self.prepare_rows(assets)
+        start = len(self._assets)
+        self.beginInsertRows(QModelIndex(), start, start + len(assets) - 1)
+        self._assets.extend(assets)
+        self._row_index.update((id(asset), row) for row, asset in enumerate(assets, start=start))
+        for column, new_text in zip(self._columns, columns):
+            column.extend(new_text)
+        for column, new_text in zip(self._columns_lower, columns_lower):
+            column.extend(new_text)
+        self.endInsertRows()
+
+    def refresh_asset(self, asset: AssetInfo):
+        """Notify views that the Name cell of an asset changed"""
+        row = self._row_index.get(id(asset))
+        if row is None:
+            return
+        name = self.name_text(asset)
+        if name == self._columns[0][row]:
+            return  # Changed marker did not toggle; nothing to repaint or re-filter
+        self._columns[0][row] = name
+        self._columns_lower[0][row] = name.lower()
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+
+class AssetFilterProxy(QSortFilterProxyModel):
+    """
+    Filter proxy evaluating FilterHeader filters against AssetTableModel rows
+    Filters map column -> list of accepted values (checkbox) or (text, match_case) tuple
+    They are compiled once per set_filters call and swept column by column into
+    a per-row accept mask, so filterAcceptsRow is a list lookup
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (col, accepted values)
+        self._checkbox_filters: list[tuple[int, frozenset[str]]] = []
+        # (col, needle, match_case); needle is pre-lowered when match_case is False
+        self._text_filters: list[tuple[int, str, bool]] = []
+        # An empty checkbox selection hides every row
+        self._reject_all = False
+        # Accept flag per source row as of the last set_filters; rows added
+        # later fall back to _accepts_row
+        self._accepted: list[bool] = []
+
+    def setSourceModel(self, source_model: AssetTableModel):  # type: ignore[override]
+        # Connected before the base class hooks up, so the mask is current by
+        # the time the proxy re-filters on these signals
+        source_model.modelAboutToBeReset.connect(self._drop_mask)
+        source_model.dataChanged.connect(self._on_source_data_changed)
+        super().setSourceModel(source_model)
+
+    def set_filters(self, filters: dict[int, list[str] | tuple[str, bool]]):
+        """Replace active filters and re-filter rows"""
+        checkbox_filters: list[tuple[int, frozenset[str]]] = []
+        text_filters: list[tuple[int, str, bool]] = []
+        reject_all = False
+        for col, val in filters.items():
+            if isinstance(val, list):
+                if not val:
+                    reject_all = True
+                checkbox_filters.append((col, frozenset(val)))
+            elif isinstance(val, tuple) and val[0]:
+                text, match_case = val
+                text_filters.append((col, text if match_case else text.lower(), match_case))
+        self._checkbox_filters = checkbox_filters
+        self._text_filters = text_filters
+        self._reject_all = reject_all
+        self._accepted = self._build_mask()
+        self.invalidateFilter()
+
+    def _build_mask(self) -> list[bool]:
+        """Evaluate the filters over every source row, one column at a time"""
+        source: AssetTableModel = self.sourceModel()  # type: ignore[assignment]
+        row_count = source.rowCount()
+        if self._reject_all:
+            return [False] * row_count
+
+        accepted = [True] * row_count
+        for col, values in self._checkbox_filters:
+            keys = source.column_filter_keys(col)
+            accepted = [ok and key in values for ok, key in zip(accepted, keys)]
+        for col, needle, match_case in self._text_filters:
+            column = source.column_text(col) if match_case else source.column_text_lower(col)
+            accepted = [ok and needle in text for ok, text in zip(accepted, column)]
+        return accepted
+
+    def _drop_mask(self):
+        self._accepted = []
+
+    def _on_source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()):
+        accepted = self._accepted
+        for row in range(top_left.row(), min(bottom_right.row() + 1, len(accepted))):
+            accepted[row] = self._accepts_row(row)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: _ModelIndex) -> bool:  # type: ignore[override]
+        accepted = self._accepted
+        if source_row < len(accepted):
+            return accepted[source_row]
+        return self._accepts_row(source_row)
+
+    def _accepts_row(self, source_row: int) -> bool:
+        """Evaluate the filters for a single source row"""
+        if self._reject_all:
+            return False
+        source: AssetTableModel = self.sourceModel()  # type: ignore[assignment]
+
+        # Checkbox filters
+        if self._checkbox_filters:
+            asset = source.asset_at(source_row)
+            for col, accepted in self._checkbox_filters:
+                user_data = AssetTableModel.cell_user_data(asset, col)
+                check_val = user_data if user_data is not None else source.cell_text(source_row, col)
+                if check_val not in accepted:
+                    return False
+
+        # Text search filters
+        for col, needle, match_case in self._text_filters:
+            if match_case:
+                haystack = source.cell_text(source_row, col)
+            else:
+                haystack = source.cell_text_lower(source_row, col)
+            if haystack.find(needle) < 0:
+                return False
+
+        return True
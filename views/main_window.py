@@ -4,16 +4,17 @@ Composes all UI components and wires them with ViewModel
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-from PySide6.QtCore import QObject, QSize, Qt, QTimer, QEvent, Signal
+from PySide6.QtCore import QObject, QSettings, QSize, Qt, QTimer, QEvent, Signal
 from PySide6.QtCore import QMimeData
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QStatusBar, QProgressBar, QSplitter,
-    QFileDialog, QMessageBox
+    QFileDialog, QMessageBox, QCheckBox
 )
 
 from viewmodels import MainViewModel
@@ -23,9 +24,40 @@ from utilities import FileDropWidget, get_resource_str
 from services import StatusBarHandler
 from models import AssetInfo, EditResult
 
+if TYPE_CHECKING:
+    from views.save_dialog import SaveDialog
+
 
 log = logging.getLogger("ABVME")
 
+# Quiet period after a selection change before the preview is rebuilt
+PREVIEW_DEBOUNCE_MS = 80
+# Minimum interval between progress bar repaints (~30 Hz)
+PROGRESS_UPDATE_MS = 33
+# Window in which forwarded log records are coalesced into one status update
+LOG_COALESCE_MS = 50
+
+# Event types handled by eventFilter on preview drop targets
+_DRAG_TYPES = frozenset({
+    QEvent.Type.DragEnter,
+    QEvent.Type.DragMove,
+    QEvent.Type.GraphicsSceneDragEnter,
+    QEvent.Type.GraphicsSceneDragMove,
+})
+_DROP_TYPES = frozenset({QEvent.Type.Drop, QEvent.Type.GraphicsSceneDrop})
+
+# QSettings location and key of the "don't ask again" choice for drop edits
+# (turned back on from the Settings menu)
+_SETTINGS_ORG = "ABVME"
+_SETTINGS_APP = "prefs"
+_SKIP_DROP_CONFIRM_KEY = "edit/skip_drop_confirmation"
+
+
+@lru_cache(maxsize=None)
+def _icon(path: str) -> QIcon:
+    """Get a shared QIcon for a bundled resource path"""
+    return QIcon(get_resource_str(path))
+
 
 class ABVMEMainWindow(QMainWindow):
     """
@@ -41,14 +73,52 @@ class ABVMEMainWindow(QMainWindow):
         self.setWindowTitle("ABVME")
         self.setMinimumSize(1000, 600)
         
-        # Create ViewModel
-        self.viewmodel = MainViewModel()
+        # ViewModel is created on the first event-loop turn, after the window
+        # has been shown; see _init_viewmodel
+        self.viewmodel: MainViewModel = None  # type: ignore[assignment]
+        self._pending_load_paths: list[str] = []
+        
+        # Only the last selection of a burst (e.g. a drag over rows) is previewed
+        self._pending_preview_selection: list[AssetInfo] = []
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._apply_pending_preview)
+        
+        # Open SaveDialog, if any, and widgets whose drops are routed through eventFilter
+        self._save_dialog: SaveDialog | None = None
+        self._preview_drop_targets: set[QWidget] = set()
+        self._preview_drop_target_ids: set[int] = set()  # For the per-event check in eventFilter
         
         # Initialize UI
         self._setup_status_bar()
         self._setup_ui()
-        self._connect_viewmodel()
         self._setup_logging()
+        self.centralWidget().setEnabled(False)  # Until the ViewModel is wired
+        QTimer.singleShot(0, self._init_viewmodel)
+        
+    def _init_viewmodel(self):
+        """Create ViewModel and bind it to the View"""
+        self.viewmodel = MainViewModel()
+        self._connect_viewmodel()
+        self.centralWidget().setEnabled(True)
+        
+        if self._pending_load_paths:
+            paths = self._pending_load_paths
+            self._pending_load_paths = []
+            self.viewmodel.load_files_from_paths(paths)
+            
+    def load_files(self, paths: list[str]):
+        """
+        Load bundle files, or queue them if the ViewModel is not created yet
+        
+        Args:
+            paths: List of file paths to load
+        """
+        if self.viewmodel is None:
+            self._pending_load_paths.extend(paths)
+        else:
+            self.viewmodel.load_files_from_paths(paths)
         
     def _setup_status_bar(self):
         """Setup status bar with progress indicator"""
@@ -66,8 +136,20 @@ class ABVMEMainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         self.status_bar.addPermanentWidget(self.progress_bar)
         
+        # Stops a running load or save; the status bar stays enabled while busy
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self._on_cancel_clicked)
+        self.status_bar.addPermanentWidget(self.cancel_button)
+        
         self._active_background_tasks = 0
         
+        # Progress reports are coalesced and applied at most every PROGRESS_UPDATE_MS
+        self._pending_progress: tuple[int, int, str, str, bool] | None = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_UPDATE_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
         # Status timer for auto-clear
         self.status_timer = QTimer(self)
         self.status_timer.setSingleShot(True)
@@ -78,6 +160,13 @@ class ABVMEMainWindow(QMainWindow):
         # Connect signal
         self.log_signal.connect(self._on_log_received)
         
+        # Only the latest record of a burst reaches the status bar
+        self._pending_log: tuple[str, int] | None = None
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_COALESCE_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        
         # Setup handler
         self.status_handler = StatusBarHandler(self.log_signal)
         logger = logging.getLogger("ABVME")
@@ -89,6 +178,9 @@ class ABVMEMainWindow(QMainWindow):
         self.setCentralWidget(central_widget)
         main_layout = QHBoxLayout(central_widget)
         
+        # Menu Bar: Preferences
+        self._setup_menu_bar()
+        
         # Left Panel: Asset List
         self._setup_left_panel()
         
@@ -110,6 +202,29 @@ class ABVMEMainWindow(QMainWindow):
         
         main_layout.addWidget(splitter)
         
+    def _setup_menu_bar(self):
+        """Setup menu bar with preference toggles"""
+        settings_menu = self.menuBar().addMenu("Settings")
+        self.confirm_drop_action = settings_menu.addAction("Confirm Drag && Drop Edits")
+        self.confirm_drop_action.setCheckable(True)
+        self.confirm_drop_action.triggered.connect(self._on_confirm_drop_triggered)
+        # The confirmation dialog can change the setting, so read it on every open
+        settings_menu.aboutToShow.connect(self._sync_settings_menu)
+        
+    def _sync_settings_menu(self):
+        """Reflect stored preferences in the Settings menu"""
+        settings = QSettings(_SETTINGS_ORG, _SETTINGS_APP)
+        skip = settings.value(_SKIP_DROP_CONFIRM_KEY, False, type=bool)
+        self.confirm_drop_action.setChecked(not skip)
+        
+    def _on_confirm_drop_triggered(self, checked: bool):
+        """Turn the drag & drop edit confirmation on or off"""
+        settings = QSettings(_SETTINGS_ORG, _SETTINGS_APP)
+        if checked:
+            settings.remove(_SKIP_DROP_CONFIRM_KEY)
+        else:
+            settings.setValue(_SKIP_DROP_CONFIRM_KEY, True)
+        
     def _setup_left_panel(self):
         """Setup left panel with load button and asset table"""
         self.left_panel = FileDropWidget()
@@ -121,7 +236,7 @@ class ABVMEMainWindow(QMainWindow):
         # Buttons layout
         button_layout = QHBoxLayout()
         self.load_button = QPushButton("  Open Files")
-        self.load_button.setIcon(QIcon(get_resource_str("assets/folder-open-regular.svg")))
+        self.load_button.setIcon(_icon("assets/folder-open-regular.svg"))
         self.load_button.setIconSize(QSize(16, 16))
         self.load_button.clicked.connect(self._on_load_button_clicked)
         button_layout.addWidget(self.load_button)
@@ -129,7 +244,7 @@ class ABVMEMainWindow(QMainWindow):
         
         # Save button
         self.save_button = QPushButton("  Save as...")
-        self.save_button.setIcon(QIcon(get_resource_str("assets/floppy-disk-regular.svg")))
+        self.save_button.setIcon(_icon("assets/floppy-disk-regular.svg"))
         self.save_button.setIconSize(QSize(16, 16))
         self.save_button.setEnabled(False)
         self.save_button.clicked.connect(self._on_save_button_clicked)
@@ -158,14 +273,14 @@ class ABVMEMainWindow(QMainWindow):
         actions_layout.addStretch()
         
         self.edit_button = QPushButton("  Edit")
-        self.edit_button.setIcon(QIcon(get_resource_str("assets/wand-magic-sparkles-solid.svg")))
+        self.edit_button.setIcon(_icon("assets/wand-magic-sparkles-solid.svg"))
         self.edit_button.setIconSize(QSize(16, 16))
         self.edit_button.setEnabled(False)
         self.edit_button.clicked.connect(self._on_edit_button_clicked)
         actions_layout.addWidget(self.edit_button)
         
         self.export_button = QPushButton("  Export")
-        self.export_button.setIcon(QIcon(get_resource_str("assets/file-export-solid.svg")))
+        self.export_button.setIcon(_icon("assets/file-export-solid.svg"))
         self.export_button.setIconSize(QSize(16, 16))
         self.export_button.setEnabled(False)
         self.export_button.clicked.connect(self._on_export_button_clicked)
@@ -183,10 +298,16 @@ class ABVMEMainWindow(QMainWindow):
         
     def _setup_preview_drop_filters(self):
         """Setup event filters for drag & drop on preview widgets"""
-        self._preview_drop_targets = self.preview_panel.get_preview_widgets()
-        for target in self._preview_drop_targets:
+        self._add_preview_drop_targets(self.preview_panel.get_preview_widgets())
+        self.preview_panel.preview_widgets_added.connect(self._add_preview_drop_targets)
+        
+    def _add_preview_drop_targets(self, widgets):
+        """Route drag & drop events of preview widgets through eventFilter"""
+        for target in widgets:
             target.setAcceptDrops(True)
             target.installEventFilter(self)
+        self._preview_drop_targets.update(widgets)
+        self._preview_drop_target_ids.update(id(target) for target in widgets)
             
     def _connect_viewmodel(self):
         """Connect ViewModel signals to View slots"""
@@ -194,14 +315,18 @@ class ABVMEMainWindow(QMainWindow):
         self.viewmodel.loading_started.connect(self._on_loading_started)
         self.viewmodel.loading_progress.connect(self._on_loading_progress)
         self.viewmodel.loading_finished.connect(self._on_loading_finished)
-        self.viewmodel.assets_loaded.connect(self._on_assets_loaded)
+        self.viewmodel.assets_batch_loaded.connect(self._on_assets_batch_loaded)
+        self.viewmodel.assets_load_finished.connect(self._on_assets_load_finished)
         
         # Edit signals
         self.viewmodel.edit_started.connect(self._on_edit_started)
         self.viewmodel.edit_finished.connect(self._on_edit_finished)
         
         # Export signals
+        self.viewmodel.export_started.connect(self._on_export_started)
+        self.viewmodel.export_progress.connect(self._on_export_progress)
         self.viewmodel.export_completed.connect(self._on_export_completed)
+        self.viewmodel.export_finished.connect(self._on_export_finished)
         
         # Save signals
         self.viewmodel.save_started.connect(self._on_save_started)
@@ -218,38 +343,36 @@ class ABVMEMainWindow(QMainWindow):
     
     def _on_loading_started(self, message: str):
         """Handle loading started"""
-        self.setEnabled(False)
+        self._set_busy(True)
         self.asset_table.clear_table()
         self.preview_panel.show_placeholder()
+        self.preview_panel.clear_pixmap_cache()
         self._begin_background_task(message, show_progress=True)
         
     def _on_loading_progress(self, current: int, total: int, filename: str):
         """Handle loading progress update"""
-        if total == 1:
-            self.progress_bar.setRange(0, 0)
-        else:
-            current -= 1
-            self.progress_bar.setRange(0, total)
-            self.progress_bar.setValue(current)
-            self.progress_bar.setFormat(f"{current}/{total}")
-            self.status_bar.showMessage(f"Loading: {filename}")
+        self._queue_progress(current, total, filename, "Loading")
         
     def _on_loading_finished(self, message: str):
         """Handle loading finished"""
-        self.setEnabled(True)
+        self._set_busy(False)
         # Reset progress bar to busy indicator mode
         self.progress_bar.setRange(0, 0)
         self.progress_bar.setTextVisible(False)
         self._end_background_task(message)
         
-    def _on_assets_loaded(self, assets: list[AssetInfo]):
-        """Handle assets loaded into table"""
-        self.asset_table.load_assets(assets)
+    def _on_assets_batch_loaded(self, assets: list[AssetInfo]):
+        """Handle a chunk of loaded assets"""
+        self.asset_table.append_assets(assets)
+        
+    def _on_assets_load_finished(self, count: int):
+        """Handle all loaded assets delivered to table"""
+        self.asset_table.finish_loading()
         self.preview_panel.show_placeholder("Select an asset from the list to view its preview.")
         self.asset_table.apply_filter(clear=True)
         
         # Enable Save button if files loaded
-        self.save_button.setEnabled(len(assets) > 0)
+        self.save_button.setEnabled(count > 0)
         
     def _on_edit_started(self, message: str):
         """Handle edit started"""
@@ -262,10 +385,32 @@ class ABVMEMainWindow(QMainWindow):
             self._refresh_preview()
             self.asset_table.refresh_asset_display(asset)
             
+    def _on_export_started(self, message: str):
+        """Handle multi-asset export started"""
+        self._begin_background_task(message, show_progress=True)
+        
+    def _on_export_progress(self, current: int, total: int, name: str):
+        """Handle multi-asset export progress update"""
+        # ExportWorker reports assets as they finish, not before they start
+        self._queue_progress(current, total, name, "Exporting", completed=True)
+        
     def _on_export_completed(self, message: str, level: int):
         """Handle export completed"""
         self._on_status_message(message, level)
         
+    def _on_export_finished(self, success: int, total: int):
+        """Handle multi-asset export finished"""
+        self._end_background_task()
+        message = f"Successfully exported {success} asset(s)."
+        if success != total:
+            message += f"Failed to export {total - success} asset(s)."
+        QMessageBox.information(
+            self,
+            "Export Completed",
+            message,
+            QMessageBox.StandardButton.Ok
+        )
+        
     def _on_selection_changed(self, count: int):
         """Handle selection changed"""
         self.export_button.setEnabled(count > 0)
@@ -279,37 +424,51 @@ class ABVMEMainWindow(QMainWindow):
         
     def _on_status_message(self, message: str, level: int):
         """Handle status message"""
+        # A direct message supersedes log records still waiting to be shown
+        self._drop_pending_log()
+        self._show_status(message, level)
+        
+    def _show_status(self, message: str, level: int):
+        """Show a message in the status bar, auto-clearing INFO messages"""
         self.status_bar.showMessage(message)
         if level == logging.INFO:
             self.status_timer.start(10000)
             
     def _on_log_received(self, msg: str, level: int):
         """Handle log message received"""
-        self._on_status_message(msg, level)
+        self._pending_log = (msg, level)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+            
+    def _flush_log(self):
+        """Show the latest log record received since the last flush"""
+        if self._pending_log is None:
+            return
+        msg, level = self._pending_log
+        self._pending_log = None
+        self._show_status(msg, level)
+        
+    def _drop_pending_log(self):
+        """Discard a coalesced log record so it cannot overwrite a newer message"""
+        self._pending_log = None
+        self._log_flush_timer.stop()
         
     def _on_save_started(self, message: str):
         """Handle save operation started"""
-        self.setEnabled(False)
+        self._set_busy(True)
         self._begin_background_task(message, show_progress=True)
         
     def _on_save_progress(self, current: int, total: int, filename: str):
         """Handle save progress update"""
-        if total == 1:
-            self.progress_bar.setRange(0, 0)
-        else:
-            current -= 1
-            self.progress_bar.setRange(0, total)
-            self.progress_bar.setValue(current)
-            self.progress_bar.setFormat(f"{current}/{total}")
-            self.status_bar.showMessage(f"Saving: {filename}")
+        self._queue_progress(current, total, filename, "Saving")
         
     def _on_save_finished(self, success: bool, message: str):
         """Handle save operation completed"""
-        self.setEnabled(True)
+        self._set_busy(False)
         self._end_background_task(message)
         
         # Close dialog if it exists
-        if hasattr(self, '_save_dialog') and self._save_dialog:
+        if self._save_dialog is not None:
             self._save_dialog.on_save_finished(success, message)
         
     # ===== UI Event Handlers =====
@@ -332,8 +491,12 @@ class ABVMEMainWindow(QMainWindow):
     def _on_table_selection_changed(self, selected_assets: list[AssetInfo]):
         """Handle table selection changed"""
         self.viewmodel.update_selection(selected_assets)
+        self._pending_preview_selection = selected_assets
+        self._preview_timer.start()
         
-        # Update preview
+    def _apply_pending_preview(self):
+        """Update preview for the last selection of a burst"""
+        selected_assets = self._pending_preview_selection
         if len(selected_assets) == 0:
             self.preview_panel.show_placeholder("Select an asset from the list to view its preview.")
         elif len(selected_assets) == 1:
@@ -360,6 +523,7 @@ class ABVMEMainWindow(QMainWindow):
         self._save_dialog = dialog
         
         dialog.exec()
+        self._save_dialog = None
         
     def _handle_save_all(
         self, 
@@ -370,7 +534,7 @@ class ABVMEMainWindow(QMainWindow):
         from pathlib import Path
         
         success = self.viewmodel.save_all_files(Path(output_dir), packer)
-        if not success and hasattr(self, '_save_dialog'):
+        if not success and self._save_dialog is not None:
             # Re-enable dialog if save didn't start
             self._save_dialog.setEnabled(True)
             
@@ -389,7 +553,7 @@ class ABVMEMainWindow(QMainWindow):
         output_filename = output_path_obj.name
         
         success = self.viewmodel.save_selected_file(filepath, output_dir, packer, output_filename)
-        if not success and hasattr(self, '_save_dialog'):
+        if not success and self._save_dialog is not None:
             # Re-enable dialog if save didn't start
             self._save_dialog.setEnabled(True)
             
@@ -403,7 +567,7 @@ class ABVMEMainWindow(QMainWindow):
         from pathlib import Path
         
         success = self.viewmodel.save_multiple_files(filepaths, Path(output_dir), packer)
-        if not success and hasattr(self, '_save_dialog'):
+        if not success and self._save_dialog is not None:
             # Re-enable dialog if save didn't start
             self._save_dialog.setEnabled(True)
         
@@ -433,8 +597,9 @@ class ABVMEMainWindow(QMainWindow):
             
     def _on_export_button_clicked(self):
         """Handle export button click"""
-        if len(self.viewmodel.selected_assets) == 1:
-            asset = self.viewmodel.selected_assets[0]
+        selected_assets = self.viewmodel.get_selected_assets()
+        if len(selected_assets) == 1:
+            asset = selected_assets[0]
             if not asset.is_exportable:
                 self._on_status_message(
                     f"Export not supported for {asset.obj_type.name}.", 
@@ -447,7 +612,7 @@ class ABVMEMainWindow(QMainWindow):
                     QMessageBox.StandardButton.Ok
                 )
                 return
-        if not self.viewmodel.selected_assets:
+        if not selected_assets:
             self._on_status_message("Select assets to export.", logging.WARNING)
             QMessageBox.information(
                 self,
@@ -457,14 +622,13 @@ class ABVMEMainWindow(QMainWindow):
             )
             return
             
-        if len(self.viewmodel.selected_assets) == 1:
-            self._export_single_asset()
+        if len(selected_assets) == 1:
+            self._export_single_asset(selected_assets[0])
         else:
-            self._export_multiple_assets()
+            self._export_multiple_assets(selected_assets)
             
-    def _export_single_asset(self):
+    def _export_single_asset(self, asset: AssetInfo):
         """Export single selected asset"""
-        asset = self.viewmodel.selected_assets[0]
         suggested_name = self.viewmodel.get_suggested_export_filename(asset)
         suggested_path = Path.cwd() / suggested_name
         
@@ -478,7 +642,7 @@ class ABVMEMainWindow(QMainWindow):
         if file_path:
             self.viewmodel.export_single_asset(asset, Path(file_path))
 
-    def _export_multiple_assets(self):
+    def _export_multiple_assets(self, assets: list[AssetInfo]):
         """Export multiple selected assets"""
         output_dir = QFileDialog.getExistingDirectory(
             self,
@@ -487,19 +651,7 @@ class ABVMEMainWindow(QMainWindow):
         )
         
         if output_dir:
-            success, total =self.viewmodel.export_multiple_assets(
-                self.viewmodel.selected_assets, 
-                Path(output_dir)
-            )
-            message = f"Successfully exported {success} asset(s)."
-            if success != total:
-                message += f"Failed to export {total - success} asset(s)."
-            QMessageBox.information(
-                self,
-                "Export Completed",
-                message,
-                QMessageBox.StandardButton.Ok
-            )
+            self.viewmodel.export_multiple_assets(assets, Path(output_dir))
 
     # ===== Drag & Drop Handlers =====
     
@@ -517,7 +669,12 @@ class ABVMEMainWindow(QMainWindow):
             )
             return False
             
-        file_path = next((Path(p) for p in paths if Path(p).is_file()), None)
+        file_path = None
+        for p in paths:
+            candidate = Path(p)
+            if candidate.is_file():
+                file_path = candidate
+                break
         if not file_path:
             self._on_status_message(
                 "Drag-drop must contain at least one file.", 
@@ -525,38 +682,42 @@ class ABVMEMainWindow(QMainWindow):
             )
             return False
             
-        reply = QMessageBox.question(
-            self,
-            "Confirm Edit",
-            f"Apply '{file_path.name}' to '{asset.name}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-        )
-        
-        if reply != QMessageBox.StandardButton.Yes:
-            return False
+        settings = QSettings(_SETTINGS_ORG, _SETTINGS_APP)
+        if settings.value(_SKIP_DROP_CONFIRM_KEY, False, type=bool):
+            self._on_status_message(
+                f"Applying '{file_path.name}' to '{asset.name}'...",
+                logging.INFO
+            )
+        else:
+            confirm = QMessageBox(
+                QMessageBox.Icon.Question,
+                "Confirm Edit",
+                f"Apply '{file_path.name}' to '{asset.name}'?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                self,
+            )
+            confirm.setCheckBox(QCheckBox("Don't ask again"))
+            
+            if confirm.exec() != QMessageBox.StandardButton.Yes:
+                return False
+            if confirm.checkBox().isChecked():
+                settings.setValue(_SKIP_DROP_CONFIRM_KEY, True)
             
         return self.viewmodel.edit_asset(asset, str(file_path))
         
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
         """Event filter for preview drop targets"""
-        if watched in getattr(self, "_preview_drop_targets", []):
+        if id(watched) in self._preview_drop_target_ids:
             event_type = event.type()
-            drag_enter_types = {
-                QEvent.Type.DragEnter,
-                QEvent.Type.DragMove,
-                QEvent.Type.GraphicsSceneDragEnter,
-                QEvent.Type.GraphicsSceneDragMove,
-            }
-            drop_types = {QEvent.Type.Drop, QEvent.Type.GraphicsSceneDrop}
 
-            if event_type in drag_enter_types:
+            if event_type in _DRAG_TYPES:
                 if self._preview_can_accept_drop(event):
                     event.accept()
                 else:
                     event.ignore()
                 return True
 
-            if event_type in drop_types:
+            if event_type in _DROP_TYPES:
                 paths = self._event_local_file_paths(event)
                 if not paths:
                     event.ignore()
@@ -574,7 +735,16 @@ class ABVMEMainWindow(QMainWindow):
         """Check if preview can accept specific drop event"""
         if not self._can_accept_preview_drop():
             return False
-        return bool(self._event_local_file_paths(event))
+        return self._has_local_file(event)
+        
+    @staticmethod
+    def _has_local_file(event: QEvent) -> bool:
+        """Check if drag event carries at least one local file URL"""
+        get_mime = getattr(event, "mimeData", None)
+        mime_data = get_mime() if callable(get_mime) else None
+        if not isinstance(mime_data, QMimeData) or not mime_data.hasUrls():
+            return False
+        return any(url.isLocalFile() for url in mime_data.urls())
         
     @staticmethod
     def _event_local_file_paths(event: QEvent) -> list[str]:
@@ -587,6 +757,23 @@ class ABVMEMainWindow(QMainWindow):
         
     # ===== Helper Methods =====
     
+    def _set_busy(self, busy: bool):
+        """
+        Lock the UI during a load or save, leaving the status bar (and its
+        Cancel button) usable
+        """
+        self.centralWidget().setEnabled(not busy)
+        self.menuBar().setEnabled(not busy)
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setVisible(busy)
+        
+    def _on_cancel_clicked(self):
+        """Request the running load or save to stop"""
+        self.cancel_button.setEnabled(False)
+        self.status_bar.showMessage("Cancelling...")
+        self.viewmodel.cancel_loading()
+        self.viewmodel.cancel_save()
+        
     def _begin_background_task(self, message: str, show_progress: bool = False):
         """Begin background task (show progress indicator)
         
@@ -604,10 +791,47 @@ class ABVMEMainWindow(QMainWindow):
             self.progress_bar.setTextVisible(False)
         self.status_bar.showMessage(message)
 
+    def _queue_progress(self, current: int, total: int, filename: str, action: str, completed: bool = False):
+        """
+        Record latest progress; the progress timer applies it
+        
+        Args:
+            completed: True if current counts finished items (export), False if it
+                is the item about to be processed (load, save)
+        """
+        self._pending_progress = (current, total, filename, action, completed)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+            
+    def _flush_progress(self):
+        """Apply the latest recorded progress to the progress bar"""
+        pending = self._pending_progress
+        if pending is None:
+            self._progress_timer.stop()
+            return
+        self._pending_progress = None
+        
+        current, total, filename, action, completed = pending
+        if total == 1:
+            self.progress_bar.setRange(0, 0)
+        else:
+            if not completed:
+                current -= 1
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(current)
+            self.progress_bar.setFormat(f"{current}/{total}")
+            self.status_bar.showMessage(f"{action}: {filename}")
+            
     def _end_background_task(self, message: str | None = None):
         """End background task (hide progress indicator if no more tasks)"""
         self._active_background_tasks = max(0, self._active_background_tasks - 1)
+        # Log records of the finished task must not overwrite the final message
+        if message or self._active_background_tasks == 0:
+            self._drop_pending_log()
         if self._active_background_tasks == 0:
+            # Neither must its progress
+            self._pending_progress = None
+            self._progress_timer.stop()
             self.progress_bar.setVisible(False)
             if message:
                 self.status_bar.showMessage(message)
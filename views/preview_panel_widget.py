@@ -3,25 +3,125 @@ Preview Panel Widget - View component for displaying asset previews
 """
 
 import logging
-from PySide6.QtCore import Qt
+import weakref
+from collections import OrderedDict
+
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache, QTextCursor
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QStackedWidget, QTextEdit, QLabel, QTabWidget
+    QWidget, QVBoxLayout, QStackedWidget, QPlainTextEdit, QLabel, QTabWidget
 )
 from PIL.Image import Image
 
 from views.components.photoviewer import PhotoViewer
-from models import AssetInfo, ResultStatus
+from models import AssetInfo, PreviewResult, ResultStatus
 
 log = logging.getLogger("ABVME")
 
+# Memory budget of QPixmapCache (KB) for converted texture pixmaps
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+# Number of images whose QPixmapCache key is remembered
+PIXMAP_KEY_LIMIT = 64
+# Longest side (px) of texture preview pixmaps; larger textures are downscaled once
+PREVIEW_MAX_SIZE = 2048
+# Characters of dump text inserted per event-loop turn
+DUMP_CHUNK_SIZE = 64 * 1024
+
+# Characters of exported OBJ data shown for Mesh assets
+MESH_SNIPPET_LENGTH = 500
+# Characters of TextAsset content shown in the text editor
+TEXT_PREVIEW_LIMIT = 1_048_576
+
+FAIL_TEMPLATE = "Preview failed for {type} (Status: {status}):\n{msg}"
+
+_STACK_STYLE = (
+    "QStackedWidget {"
+    " border: 1px solid #616161;"
+    " border-radius: 4px;"
+    " background-color: #1f1f1f;"
+    "}"
+)
+
+
+def _truncate_for_display(text: str, limit: int) -> str:
+    """Cut text to limit characters, noting how much was left out"""
+    if len(text) <= limit:
+        return str(text)
+    # Slice before str() so oversized data is not copied whole
+    return f"{str(text[:limit])}\n... (truncated, {len(text) - limit} characters more)"
+
+
+def _pil_to_qpixmap(image: Image) -> QPixmap:
+    """
+    Convert a PIL image to QPixmap through a QImage viewing its RGBA bytes
+    Images larger than PREVIEW_MAX_SIZE are downscaled before upload
+    """
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    data = image.tobytes()
+    # The QImage borrows data, which stays referenced until fromImage has copied it
+    qimage = QImage(data, image.width, image.height, image.width * 4, QImage.Format.Format_RGBA8888)
+    if image.width > PREVIEW_MAX_SIZE or image.height > PREVIEW_MAX_SIZE:
+        qimage = qimage.scaled(
+            PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+        )
+    return QPixmap.fromImage(qimage)
+
+
+class _PreviewSignals(QObject):
+    """Signals for _PreviewTask (QRunnable cannot own signals)"""
+    finished = Signal(int, object, object, object)  # (token, asset, PreviewResult, error)
+
+
+class _PreviewTask(QRunnable):
+    """Generates an asset preview off the UI thread"""
+    
+    def __init__(self, token: int, asset: AssetInfo):
+        super().__init__()
+        self.token = token
+        self.asset = asset
+        self.signals = _PreviewSignals()
+        
+    def run(self):
+        try:
+            result = self.asset.get_preview()
+        except Exception as e:
+            self.signals.finished.emit(self.token, self.asset, None, e)
+        else:
+            self.signals.finished.emit(self.token, self.asset, result, None)
+
+
 class PreviewPanelWidget(QWidget):
     """
     Widget for displaying asset previews
     Supports Image, Text, and Placeholder views
+    Image and Text views are created on first use
     """
+    # Signals
+    preview_widgets_added = Signal(object)  # List of widgets created after setup that can receive drops
     
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
+        # What is currently displayed, so re-showing it can be skipped
+        self._shown_preview: PreviewResult | None = None
+        self._dump_text = ""
+        self._placeholder_text = "Preview not available"
+        self._dump_token = 0  # Invalidates pending chunks of a replaced dump
+        # asset -> (weak reference to the converted image, QPixmapCache key); the weak
+        # reference spots an image replaced by an edit without keeping it alive
+        self._pixmap_keys: OrderedDict[AssetInfo, tuple[weakref.ref[Image], QPixmapCache.Key]] = OrderedDict()
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        # Previews are generated one at a time; results carrying an older token are dropped
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(1)
+        self._preview_token = 0
+        # PreviewResult.asset_type -> page handler
+        self._preview_dispatch = {
+            "Texture2D": self._show_texture,
+            "TextAsset": self._show_text,
+            "Mesh": self._show_mesh,
+        }
         self._setup_ui()
         
     def _setup_ui(self):
@@ -36,29 +136,19 @@ class PreviewPanelWidget(QWidget):
         # ===== Tab 1: Preview =====
         # Create stacked widget for different preview types
         self.stack = QStackedWidget()
-        self.stack.setStyleSheet(
-            "QStackedWidget {"
-            " border: 1px solid #616161;"
-            " border-radius: 4px;"
-            " background-color: #1f1f1f;"
-            "}"
-        )
+        self.stack.setStyleSheet(_STACK_STYLE)
         
-        # 1. Image Viewer (for Texture2D)
-        self.image_viewer = PhotoViewer(self.stack)
+        # Image Viewer (for Texture2D) and Text Editor (for TextAsset) are
+        # added to the stack on first use, see _get_image_viewer/_get_text_editor
+        self._image_viewer: PhotoViewer | None = None
+        self._text_editor: QPlainTextEdit | None = None
+        self.image_index = -1
+        self.text_index = -1
         
-        # 2. Text Editor (for TextAsset)
-        self.text_editor = QTextEdit(self.stack)
-        self.text_editor.setReadOnly(True)
-        
-        # 3. Placeholder (for Mesh/Unsupported)
-        self.placeholder = QLabel("Preview not available")
+        # Placeholder (for Mesh/Unsupported)
+        self.placeholder = QLabel(self._placeholder_text)
         self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.placeholder.setWordWrap(True)
-        
-        # Add widgets to stack
-        self.image_index = self.stack.addWidget(self.image_viewer)
-        self.text_index = self.stack.addWidget(self.text_editor)
         self.placeholder_index = self.stack.addWidget(self.placeholder)
         
         # Initialize with placeholder
@@ -68,26 +158,91 @@ class PreviewPanelWidget(QWidget):
         self.tab_widget.addTab(self.stack, "Preview")
         
         # ===== Tab 2: Dump (parsed_data JSON) =====
-        self.dump_editor = QTextEdit()
+        self.dump_editor = QPlainTextEdit()
         self.dump_editor.setReadOnly(True)
+        self.dump_editor.setUndoRedoEnabled(False)  # Chunked inserts would otherwise be kept for undo
         self.dump_editor.setPlaceholderText("Select an asset to view its parsed data.")
         self.tab_widget.addTab(self.dump_editor, "Dump")
         
         layout.addWidget(self.tab_widget)
         
+        self._preview_widgets: frozenset[QWidget] = frozenset({
+            self.tab_widget,
+            self.stack,
+            self.placeholder,
+            self.dump_editor,
+        })
+        
     def show_placeholder(self, message: str = "Select an asset from the list to view its preview."):
         """Show placeholder with message and clear dump editor (for no asset selected)"""
+        self._preview_token += 1  # Discard any preview still being generated
+        self._shown_preview = None
         self._show_preview_placeholder(message)
-        self.dump_editor.clear()
+        self._set_dump_text("")
         
     def _show_preview_placeholder(self, message: str):
         """Show placeholder in Preview tab only (keeps dump editor content)"""
-        self.placeholder.setText(message)
-        self.stack.setCurrentIndex(self.placeholder_index)
+        if message != self._placeholder_text:
+            self._placeholder_text = message
+            self.placeholder.setText(message)
+        self._set_stack_index(self.placeholder_index)
+        
+    def _get_image_viewer(self) -> PhotoViewer:
+        """Get image viewer page, creating it on first use"""
+        if self._image_viewer is None:
+            self._image_viewer = PhotoViewer(self.stack)
+            self.image_index = self.stack.addWidget(self._image_viewer)
+            self._add_preview_widgets([self._image_viewer, self._image_viewer.viewport()])
+        return self._image_viewer
+        
+    def _get_text_editor(self) -> QPlainTextEdit:
+        """Get text editor page, creating it on first use"""
+        if self._text_editor is None:
+            self._text_editor = QPlainTextEdit(self.stack)
+            self._text_editor.setReadOnly(True)
+            self._text_editor.setUndoRedoEnabled(False)
+            self.text_index = self.stack.addWidget(self._text_editor)
+            self._add_preview_widgets([self._text_editor])
+        return self._text_editor
+        
+    def _add_preview_widgets(self, widgets: list[QWidget]):
+        """Register lazily created drop-capable widgets"""
+        self._preview_widgets = self._preview_widgets.union(widgets)
+        self.preview_widgets_added.emit(widgets)
+        
+    def _set_stack_index(self, index: int):
+        """Switch preview page if not already showing"""
+        if self.stack.currentIndex() != index:
+            self.stack.setCurrentIndex(index)
+        
+    def _set_dump_text(self, text: str):
+        """
+        Replace dump editor text, skipping the relayout when unchanged
+        Large text is inserted in chunks so the UI stays responsive
+        """
+        if text == self._dump_text:
+            return
+        self._dump_text = text
+        self._dump_token += 1
+        self.dump_editor.clear()
+        if text:
+            self._append_dump_chunk(self._dump_token, 0)
+            
+    def _append_dump_chunk(self, token: int, offset: int):
+        """Insert the next chunk of dump text and reschedule until done"""
+        if token != self._dump_token:
+            return
+        end = offset + DUMP_CHUNK_SIZE
+        cursor = QTextCursor(self.dump_editor.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(self._dump_text[offset:end])
+        if end < len(self._dump_text):
+            QTimer.singleShot(0, lambda: self._append_dump_chunk(token, end))
         
     def show_asset_preview(self, asset: AssetInfo):
         """
         Show preview for given asset
+        Previews not generated yet are built on a worker thread
         
         Args:
             asset: AssetInfo object to preview
@@ -95,63 +250,120 @@ class PreviewPanelWidget(QWidget):
         if not asset:
             self.show_placeholder("No asset selected")
             return
-
+        
+        preview_result = asset.cached_preview
+        if preview_result is not None and preview_result is self._shown_preview:
+            return  # Already displayed; edits replace the cached result
+        
+        self._preview_token += 1
+        if preview_result is not None:
+            self._display_preview(asset, preview_result)
+            return
+        
+        self._shown_preview = None
+        self._show_preview_placeholder("Loading preview...")
+        self._set_dump_text("")
+        # Drop queued requests that have not started; they would be discarded anyway
+        self._preview_pool.clear()
+        task = _PreviewTask(self._preview_token, asset)
+        task.signals.finished.connect(self._on_preview_ready)
+        self._preview_pool.start(task)
+        
+    def _on_preview_ready(self, token: int, asset: AssetInfo, preview_result, error):
+        """Show a preview generated by _PreviewTask, unless a newer one was requested"""
+        if token != self._preview_token:
+            return
+        if error is not None:
+            log.error("Error generating preview: %s", error, exc_info=error)
+            self._show_preview_placeholder(f"An unexpected error occurred during preview:\n{str(error)}")
+            return
+        self._display_preview(asset, preview_result)
+        
+    def _display_preview(self, asset: AssetInfo, preview_result: PreviewResult):
+        """Populate preview and dump widgets from a generated preview"""
         try:
-            preview_result = asset.get_preview()
+            # get_preview() is cached per asset and reset by edits, so the same
+            # result object means the panel already shows it
+            if preview_result is self._shown_preview:
+                return
+            self._shown_preview = preview_result
             
             # Always populate dump editor with parsed data
-            self.dump_editor.setText(preview_result.parsed_data)
+            self._set_dump_text(preview_result.parsed_data)
             
             if preview_result.status != ResultStatus.COMPLETE:
+                type_name = asset.obj_type.name
+                status = preview_result.status.value
                 self._show_preview_placeholder(
-                    f"Preview failed for {asset.obj_type.name} (Status: {preview_result.status.value}):\n"
-                    f"{preview_result.message}"
+                    FAIL_TEMPLATE.format(type=type_name, status=status, msg=preview_result.message)
                 )
-                log.info(f"Preview failed for {asset.obj_type.name} (Status: {preview_result.status.value}): {preview_result.message}")
+                log.info("Preview failed for %s (Status: %s): %s", type_name, status, preview_result.message)
                 return
 
-            if preview_result.asset_type == "Texture2D":
-                # Data is PIL.Image
-                if preview_result.data and isinstance(preview_result.data, Image):
-                    self.image_viewer.setPhoto(preview_result.data.toqpixmap())
-                    self.stack.setCurrentIndex(self.image_index)
-                    log.info(f"Showing Texture2D preview: {asset.name}")
-                else:
-                    self._show_preview_placeholder("Texture2D data is empty.")
-
-            elif preview_result.asset_type == "TextAsset":
-                # Data is str
-                self.text_editor.setText(str(preview_result.data))
-                self.stack.setCurrentIndex(self.text_index)
-                log.info(f"Showing TextAsset preview: {asset.name}")
-
-            elif preview_result.asset_type == "Mesh":
-                # Data is str (exported OBJ data)
-                text_data = preview_result.data if preview_result.data else "No Mesh data available."
-                self._show_preview_placeholder(
-                    f"Mesh preview (Unsupported):\n"
-                    f"Raw OBJ data snippet:\n{str(text_data)[:500]}..."
-                )
-                log.warning(f"Mesh preview unsupported: {asset.name}")
-
+            handler = self._preview_dispatch.get(preview_result.asset_type)
+            if handler:
+                handler(preview_result, asset)
             else:
                 self._show_preview_placeholder(
                     f"Preview not supported for type: {preview_result.asset_type}"
                 )
 
         except Exception as e:
-            log.error(f"Error generating preview: {e}", exc_info=True)
+            self._shown_preview = None
+            log.error("Error generating preview: %s", e, exc_info=True)
             self._show_preview_placeholder(f"An unexpected error occurred during preview:\n{str(e)}")
             
-    def get_preview_widgets(self) -> set[QWidget]:
-        """Get set of widgets that can receive drops"""
-        return {
-            self.tab_widget,
-            self.stack,
-            self.image_viewer,
-            self.image_viewer.viewport(),
-            self.text_editor,
-            self.placeholder,
-            self.dump_editor,
-        }
+    def _show_texture(self, preview_result: PreviewResult, asset: AssetInfo):
+        """Show Texture2D preview (data is PIL.Image)"""
+        data = preview_result.data
+        if isinstance(data, Image):  # Also rules out None; no truthiness test on the image
+            self._get_image_viewer().setPhoto(self._get_pixmap(asset, data))
+            self._set_stack_index(self.image_index)
+            log.info("Showing Texture2D preview: %s", asset.name)
+        else:
+            self._show_preview_placeholder("Texture2D data is empty.")
+            
+    def _show_text(self, preview_result: PreviewResult, asset: AssetInfo):
+        """Show TextAsset preview (data is str)"""
+        text_data = _truncate_for_display(preview_result.data, TEXT_PREVIEW_LIMIT)
+        self._get_text_editor().setPlainText(text_data)
+        self._set_stack_index(self.text_index)
+        log.info("Showing TextAsset preview: %s", asset.name)
+        
+    def _show_mesh(self, preview_result: PreviewResult, asset: AssetInfo):
+        """Show Mesh placeholder (data is str, exported OBJ data)"""
+        text_data = preview_result.data if preview_result.data else "No Mesh data available."
+        snippet = _truncate_for_display(text_data, MESH_SNIPPET_LENGTH)
+        self._show_preview_placeholder(
+            f"Mesh preview (Unsupported):\n"
+            f"Raw OBJ data snippet:\n{snippet}"
+        )
+        log.warning("Mesh preview unsupported: %s", asset.name)
+            
+    def _get_pixmap(self, asset: AssetInfo, image: Image) -> QPixmap:
+        """Convert an asset's preview image to QPixmap, reusing conversions still in QPixmapCache"""
+        entry = self._pixmap_keys.pop(asset, None)
+        if entry is not None:
+            image_ref, key = entry
+            pixmap = QPixmap()
+            if image_ref() is image and QPixmapCache.find(key, pixmap):
+                self._pixmap_keys[asset] = entry
+                return pixmap
+            QPixmapCache.remove(key)
+        pixmap = _pil_to_qpixmap(image)
+        self._pixmap_keys[asset] = (weakref.ref(image), QPixmapCache.insert(pixmap))
+        if len(self._pixmap_keys) > PIXMAP_KEY_LIMIT:
+            _, (_, stale_key) = self._pixmap_keys.popitem(last=False)
+            QPixmapCache.remove(stale_key)
+        return pixmap
+        
+    def clear_pixmap_cache(self):
+        """Drop cached texture pixmaps (for assets that are being unloaded)"""
+        for _, key in self._pixmap_keys.values():
+            QPixmapCache.remove(key)
+        self._pixmap_keys.clear()
+        
+    def get_preview_widgets(self) -> frozenset[QWidget]:
+        """Get set of widgets that can receive drops (pages created later are announced by preview_widgets_added)"""
+        return self._preview_widgets
 
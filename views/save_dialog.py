@@ -4,8 +4,9 @@ Save Dialog - Dialog for saving bundle files with compression options
 
 from pathlib import Path
 from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
+    QDialog, QVBoxLayout, QHBoxLayout, QListView, QAbstractItemView,
     QPushButton, QComboBox, QLabel, QFileDialog, QMessageBox
 )
 
@@ -32,6 +33,9 @@ class SaveDialog(QDialog):
         super().__init__(parent)
         self.viewmodel = viewmodel
         self.output_dir = None
+        # Fallback locations for the file dialogs until output_dir is chosen
+        self._default_dir = Path.cwd()
+        self._default_output_dir = self._default_dir / "output"
         self._setup_ui()
         self._load_files()
         
@@ -44,16 +48,20 @@ class SaveDialog(QDialog):
         # Main layout
         main_layout = QHBoxLayout(self)
         
-        # Left side: File list
-        self.file_list = QListWidget()
+        # Left side: File list (rows carry the file path as UserRole data)
+        self.file_model = QStandardItemModel(self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_model)
+        self.file_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.file_list.setAlternatingRowColors(True)
-        self.file_list.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
-        self.file_list.setHorizontalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
+        self.file_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.file_list.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.file_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         self.file_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         self.file_list.verticalScrollBar().setSingleStep(10)
         self.file_list.horizontalScrollBar().setSingleStep(10)
-        self.file_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self.file_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.file_list.setUniformItemSizes(True)
         main_layout.addWidget(self.file_list, stretch=3)
         
         # Right side: Controls
@@ -66,7 +74,8 @@ class SaveDialog(QDialog):
         controls_layout.addWidget(compression_label)
         
         self.compression_combo = QComboBox()
-        self.compression_combo.addItems(list(self.COMPRESSION_MODES.keys()))
+        for label, packer in self.COMPRESSION_MODES.items():
+            self.compression_combo.addItem(label, packer)
         self.compression_combo.setCurrentText("Original")
         controls_layout.addWidget(self.compression_combo)
         
@@ -88,46 +97,43 @@ class SaveDialog(QDialog):
         main_layout.addLayout(controls_layout, stretch=1)
         
         # Connect selection change
-        self.file_list.itemSelectionChanged.connect(self._on_selection_changed)
+        self.file_list.selectionModel().selectionChanged.connect(self._on_selection_changed)
         
     def _load_files(self):
         """Load source files into list"""
         files = self.viewmodel.get_source_files()
+        has_changed = False
         
-        for filepath, is_changed in files:
-            filename = Path(filepath).name
-            
-            # Create list item
-            item = QListWidgetItem(filename)
-            item.setData(Qt.ItemDataRole.UserRole, filepath)
-            
-            # Mark changed files with asterisk
-            if is_changed:
-                item.setText(f"{filename} *")
-                item.setToolTip(f"{filepath} (modified)")
-            else:
-                item.setToolTip(filepath)
-            
-            self.file_list.addItem(item)
+        # Display text and tooltip (changed files marked with asterisk) come precomputed
+        items = []
+        for filepath, display_text, tooltip, is_changed in files:
+            item = QStandardItem(display_text)
+            item.setData(filepath, Qt.ItemDataRole.UserRole)
+            item.setToolTip(tooltip)
+            items.append(item)
+            has_changed |= is_changed
         
         # Update button states
         has_files = len(files) > 0
-        has_changed = self.viewmodel.has_changed_files()
         
         self.save_all_btn.setEnabled(has_changed)
         
         if not has_files:
-            self.file_list.addItem("No files loaded")
+            item = QStandardItem("No files loaded")
+            item.setSelectable(False)
+            items.append(item)
+        
+        # Inserted in one batch so the view relayouts once
+        self.file_model.invisibleRootItem().appendRows(items)
             
     def _on_selection_changed(self):
         """Handle selection change"""
-        has_selection = len(self.file_list.selectedItems()) > 0
+        has_selection = self.file_list.selectionModel().hasSelection()
         self.save_selected_btn.setEnabled(has_selection)
         
     def _get_compression_mode(self) -> str:
         """Get selected compression mode"""
-        mode_text = self.compression_combo.currentText()
-        return self.COMPRESSION_MODES.get(mode_text, "original")
+        return self.compression_combo.currentData() or "original"
         
     def _select_output_directory(self) -> bool:
         """
@@ -135,7 +141,7 @@ class SaveDialog(QDialog):
         Returns True if directory was selected, False otherwise
         """
         if self.output_dir is None:
-            default_dir = str(Path.cwd() / "output")
+            default_dir = str(self._default_output_dir)
         else:
             default_dir = str(self.output_dir)
             
@@ -164,25 +170,26 @@ class SaveDialog(QDialog):
         
     def _on_save_selected_clicked(self):
         """Handle Save Selected button click"""
-        selected_items = self.file_list.selectedItems()
-        if not selected_items:
+        filepaths = [
+            index.data(Qt.ItemDataRole.UserRole)
+            for index in self.file_list.selectionModel().selectedIndexes()
+        ]
+        if not filepaths:
             return
         
         # Check if multiple files selected
-        if len(selected_items) > 1:
-            self._save_multiple_selected(selected_items)
+        if len(filepaths) > 1:
+            self._save_multiple_selected(filepaths)
         else:
-            self._save_single_selected(selected_items[0])
+            self._save_single_selected(filepaths[0])
             
-    def _save_single_selected(self, item: QListWidgetItem):
+    def _save_single_selected(self, filepath: str):
         """Save a single selected file with Save As dialog"""
-        # Get selected file info
-        filepath = item.data(Qt.ItemDataRole.UserRole)
         filename = Path(filepath).name
         
         # Show Save As dialog
         if self.output_dir is None:
-            default_path = str(Path.cwd() / filename)
+            default_path = str(self._default_dir / filename)
         else:
             default_path = str(self.output_dir / filename)
             
@@ -207,11 +214,8 @@ class SaveDialog(QDialog):
         # Emit signal with full output path
         self.save_selected_requested.emit(filepath, str(save_path), packer)
         
-    def _save_multiple_selected(self, selected_items: list[QListWidgetItem]):
+    def _save_multiple_selected(self, filepaths: list[str]):
         """Save multiple selected files to a directory"""
-        # Collect filepaths
-        filepaths = [item.data(Qt.ItemDataRole.UserRole) for item in selected_items]
-        
         # Show directory selection dialog
         if not self._select_output_directory():
             return